@@ -1,17 +1,21 @@
 """Enhanced Streamlit chat interface for Agentic Lifelog POC Demo."""
+import functools
+import hashlib
+import html
+import itertools
 import os
+import threading
+import time
 # Suppress tokenizer parallelism warning from ChromaDB/embedding models
 os.environ["TOKENIZERS_PARALLELISM"] = "false"
 
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from datetime import datetime
 from dotenv import load_dotenv
-from src.data_store import LifelogDataStore
-from src.agentic_workflow import LifelogAgentWorkflow
-from src.background_agents import BackgroundAnalyzer
 
 # Load environment variables
 load_dotenv()
@@ -25,12 +29,16 @@ st.set_page_config(
 )
 
 # Custom CSS for enhanced UI
-st.markdown("""
+_PAGE_CSS = """
 <style>
+    :root {
+        --accent: #76B900;
+        --accent-dark: #5a9400;
+    }
     .main-header {
         font-size: 2.8rem;
         font-weight: bold;
-        background: linear-gradient(90deg, #76B900 0%, #5a9400 100%);
+        background: linear-gradient(90deg, var(--accent) 0%, var(--accent-dark) 100%);
         -webkit-background-clip: text;
         -webkit-text-fill-color: transparent;
         text-align: center;
@@ -47,39 +55,21 @@ st.markdown("""
         padding: 0.7rem 1.2rem;
         border-radius: 8px;
         margin: 0.4rem 0;
-        border-left: 4px solid #76B900;
+        border-left: 4px solid var(--accent);
         transition: all 0.3s ease;
     }
     .reasoning-step:hover {
         background-color: #e8eaed;
-        border-left: 4px solid #5a9400;
+        border-left: 4px solid var(--accent-dark);
     }
     .step-title {
         font-weight: bold;
-        color: #76B900;
+        color: var(--accent);
         font-size: 1.05rem;
     }
-    .stat-box {
-        background: linear-gradient(135deg, #76B900 0%, #5a9400 100%);
-        color: white;
-        padding: 1.5rem;
-        border-radius: 10px;
-        text-align: center;
-        box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-    }
-    .stat-box h3 {
-        color: white;
-        margin: 0;
-        font-size: 2.5rem;
-        font-weight: bold;
-    }
-    .stat-box p {
-        color: rgba(255,255,255,0.9);
-        margin: 0.3rem 0 0 0;
-    }
     .agent-badge {
         display: inline-block;
-        background-color: #76B900;
+        background-color: var(--accent);
         color: white;
         padding: 0.3rem 0.8rem;
         border-radius: 20px;
@@ -99,14 +89,50 @@ st.markdown("""
         background-color: #e3f2fd;
         border-left: 4px solid #2196f3 !important;
     }
-    .metric-card {
-        background-color: #f8f9fa;
-        padding: 1.5rem;
-        border-radius: 8px;
+    .metric-grid {
+        display: grid;
+        grid-template-columns: repeat(4, 1fr);
+        gap: 1rem;
+        margin-bottom: 1rem;
+    }
+    .chat-bubble {
+        padding: 0.8rem 1.2rem;
+        border-radius: 10px;
+        margin-bottom: 0.8rem;
+    }
+    .chat-user {
+        background-color: #f0f2f6;
+    }
+    .chat-assistant {
+        background-color: #ffffff;
         border: 1px solid #e0e0e0;
-        text-align: center;
     }
-    .demo-banner {
+    .chat-bubble details {
+        margin-top: 0.5rem;
+    }
+    .chat-bubble summary {
+        cursor: pointer;
+        font-weight: 600;
+    }
+    .response-metric {
+        font-size: 0.85rem;
+        color: #666;
+    }
+    .response-metric b {
+        display: block;
+        font-size: 1.6rem;
+        color: #31333f;
+    }
+</style>
+"""
+
+# Static HTML blocks rendered as self-contained components (iframes do not see _PAGE_CSS)
+_COMPONENT_FONT = "font-family: 'Source Sans Pro', sans-serif;"
+
+_DEMO_BANNER_HTML = f"""
+<style>
+    body {{ margin: 0; {_COMPONENT_FONT} }}
+    .demo-banner {{
         background: linear-gradient(90deg, #76B900 0%, #5a9400 100%);
         color: white;
         padding: 1rem;
@@ -114,14 +140,132 @@ st.markdown("""
         text-align: center;
         margin-bottom: 1rem;
         font-weight: bold;
-    }
+    }}
 </style>
-""", unsafe_allow_html=True)
+<div class="demo-banner">
+    🏆 NVIDIA GTC Hackathon 2025 - Nemotron Prize Track POC Demo<br/>
+    Showcasing: ReAct Pattern • Multi-Agent Orchestration • Safety Guardrails • Agentic RAG
+</div>
+"""
+
+_FOOTER_HTML = f"""
+<style>
+    body {{ margin: 0; {_COMPONENT_FONT} }}
+</style>
+<div style="text-align: center; color: #999; font-size: 0.85rem;">
+    <b>🏆 Built for NVIDIA GTC Hackathon 2025 - Nemotron Prize Track</b><br/>
+    Demonstrating agentic AI with ReAct pattern, multi-agent orchestration, safety guardrails, and tool integration<br/>
+    <i>Powered by NVIDIA Nemotron Super 49B v1.5 & Nemotron Safety Guard 8B v3</i>
+</div>
+"""
+
+# (category, label) for the Data Insights metric cards
+_METRIC_CARDS = [
+    ('sleep', '😴 Avg Sleep Score'),
+    ('exercise', '🏃 Avg Exercise Score'),
+    ('work', '💼 Avg Work Score'),
+    ('mood', '😊 Avg Mood Score'),
+]
+
+
+NVIDIA_LOGO_URL = "https://www.nvidia.com/content/dam/en-zz/Solutions/about-nvidia/logo-and-brand/01-nvidia-logo-vert-500x200-2c50-d@2x.png"
+
+
+@st.cache_data(show_spinner=False)
+def _logo_image():
+    """Fetch the sidebar logo once per process; fall back to the URL if the fetch fails."""
+    import requests
+    
+    try:
+        response = requests.get(NVIDIA_LOGO_URL, timeout=5)
+        response.raise_for_status()
+        return response.content
+    except requests.RequestException:
+        return NVIDIA_LOGO_URL
 
 
 @st.cache_resource
-def initialize_system():
-    """Initialize the data store and workflow (cached for performance)."""
+def _inject_css():
+    """Emit the page-level CSS once; Streamlit replays the cached element on reruns."""
+    # st.html sends the style block as-is, without a markdown parse
+    st.html(_PAGE_CSS)
+    return True
+
+
+def render_metric_cards(means):
+    """Show the four category averages as native st.metric widgets."""
+    for col, (category, label) in zip(st.columns(len(_METRIC_CARDS)), _METRIC_CARDS, strict=True):
+        value = means.get(category)
+        col.metric(label, f"{value:.1f}" if value is not None else "–")
+
+
+# (message key, label, formatter) for the per-response metrics row
+_RESPONSE_METRICS = [
+    ('react_cycles', '🔄 ReAct Cycles', str),
+    ('retrieved_entries', '📊 Entries Retrieved', str),
+    ('safety_checks', '🛡️ Safety Checks', lambda checks: str(len(checks))),
+    ('elapsed_time', '⏱️ Response Time', lambda seconds: f"{seconds:.2f}s"),
+]
+
+
+def render_response_metrics(message):
+    """Build the metrics row for an assistant message as one HTML grid (empty if none apply)."""
+    if "react_cycles" not in message and "retrieved_entries" not in message:
+        return ""
+    cells = "".join(
+        f'<div class="response-metric">{label}<b>{fmt(message[key])}</b></div>'
+        if key in message else '<div></div>'
+        for key, label, fmt in _RESPONSE_METRICS
+    )
+    return f'<div class="metric-grid">{cells}</div>'
+
+
+LIFELOG_CSV = "data/sample_lifelog.csv"
+CATEGORIES = ['mood', 'sleep', 'exercise', 'work']
+CATEGORY_COLORS = {
+    'mood': '#76B900',
+    'sleep': '#2196f3',
+    'exercise': '#ff9800',
+    'work': '#9c27b0'
+}
+TIMELINE_MAX_POINTS = 2000
+TIMELINE_MARKER_LIMIT = 200  # above this, draw lines only (one SVG marker per point is costly)
+
+
+@functools.lru_cache(maxsize=8)
+def _csv_version(csv_path, mtime):
+    """Content hash of the CSV; mtime only decides when the file is re-hashed."""
+    with open(csv_path, "rb") as f:
+        return hashlib.blake2b(f.read(), digest_size=8).hexdigest()
+
+
+def lifelog_data_key():
+    """Return the (csv_path, data_version) pair that keys every cached view of the lifelog CSV."""
+    return LIFELOG_CSV, _csv_version(LIFELOG_CSV, os.path.getmtime(LIFELOG_CSV))
+
+
+@st.cache_data
+def load_lifelog_data(csv_path=LIFELOG_CSV, data_version=None):
+    """Load and cache the lifelog data (shared by the vector store and the visualizations)."""
+    try:
+        return pd.read_csv(
+            csv_path,
+            usecols=['date', 'category', 'entry', 'mood_score'],
+            parse_dates=['date'],
+            dtype={'category': 'category', 'mood_score': 'int8'}  # scores are integers 1-5
+        )
+    except Exception as e:
+        st.error(f"Error loading data for visualization: {e}")
+        return None
+
+
+@st.cache_resource
+def initialize_system(csv_path=LIFELOG_CSV, data_version=None):
+    """Initialize the data store and workflow (cached per CSV version, so edits to the file are picked up)."""
+    # Imported here so chromadb/LangGraph load once inside the cached resource, not on every script import
+    from src.data_store import LifelogDataStore
+    from src.agentic_workflow import LifelogAgentWorkflow
+    
     # Check for API key
     api_key = os.getenv("NVIDIA_API_KEY")
     if not api_key:
@@ -133,83 +277,287 @@ def initialize_system():
     
     # Load sample data
     try:
-        count = data_store.load_and_store_csv("data/sample_lifelog.csv")
+        # Reuse the cached parse shared with the Data Insights tab
+        progress = st.progress(0.0, text="📥 Embedding lifelog entries...")
+        count = data_store.load_and_store_csv(
+            csv_path,
+            df=load_lifelog_data(csv_path, data_version),
+            data_version=data_version,
+            batch_size=200,
+            progress_callback=lambda done, total: progress.progress(
+                done / total, text=f"📥 Embedding lifelog entries... {done}/{total}"
+            )
+        )
+        progress.empty()
         stats = data_store.get_stats()
     except Exception as e:
         st.error(f"❌ Error loading data: {str(e)}")
         st.stop()
     
-    # Initialize workflow
+    # Initialize workflow and establish the shared API connection up front
     workflow = LifelogAgentWorkflow(data_store)
+    workflow.warmup()
     
-    # Run background analysis (only once per session)
-    if not st.session_state.get("insights_generated", False):
-        with st.spinner("🔄 Running background analysis..."):
-            analyzer = BackgroundAnalyzer(data_store)
-            analyzer.run_analysis()
-            st.session_state.insights_generated = True
-            st.success("✅ Background insights ready!")
+    # Run background analysis off the UI thread; the insights tool waits on it only when needed
+    workflow.attach_background_analysis(start_background_analysis(data_store, data_version))
     
     return workflow, data_store, stats
 
 
-@st.cache_data
-def load_lifelog_data():
-    """Load and cache the lifelog data for visualization."""
-    try:
-        df = pd.read_csv("data/sample_lifelog.csv")
-        df['date'] = pd.to_datetime(df['date'])
-        return df
-    except Exception as e:
-        st.error(f"Error loading data for visualization: {e}")
+@st.cache_resource
+def _bg_executor():
+    """Single worker thread shared by all sessions for background analysis."""
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="background-analysis")
+
+
+@st.cache_resource
+def _background_analyzer(_data_store, data_version=None):
+    """One BackgroundAnalyzer (and its agent clients) shared by all sessions per CSV version."""
+    from src.background_agents import BackgroundAnalyzer
+    return BackgroundAnalyzer(_data_store)
+
+
+@st.cache_resource
+def start_background_analysis(_data_store, data_version=None):
+    """Submit the background analysis once per CSV version and return its future."""
+    return _bg_executor().submit(_background_analyzer(_data_store, data_version).run_analysis)
+
+
+class WorkflowLimiter:
+    """Bounded semaphore around workflow runs that also tracks how many are waiting."""
+    
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._semaphore = threading.BoundedSemaphore(limit)
+        self._lock = threading.Lock()
+        self.in_flight = 0  # running + waiting
+    
+    def __enter__(self):
+        with self._lock:
+            self.in_flight += 1
+        self._semaphore.acquire()
+        return self
+    
+    def __exit__(self, *exc_info):
+        self._semaphore.release()
+        with self._lock:
+            self.in_flight -= 1
+    
+    @property
+    def queued(self) -> int:
+        """Number of requests waiting for a free slot."""
+        return max(0, self.in_flight - self.limit)
+
+
+@st.cache_resource
+def _workflow_limiter():
+    """Process-wide cap on concurrent workflow runs (shared by all sessions)."""
+    return WorkflowLimiter(int(os.getenv("MAX_CONCURRENT_WORKFLOWS", "4")))
+
+
+class LiveStopwatch:
+    """Background thread that refreshes an elapsed-time placeholder while a workflow runs."""
+    
+    def __init__(self, placeholder, interval: float = 0.25, step: str = "Starting"):
+        self.placeholder = placeholder
+        self.interval = interval
+        self.step = step
+        self._stop = threading.Event()
+        self._thread = None
+    
+    def __enter__(self):
+        self._start = time.perf_counter()
+        self._thread = threading.Thread(target=self._tick, daemon=True)
+        add_script_run_ctx(self._thread)  # let the thread write to this session's placeholder
+        self._thread.start()
+        return self
+    
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        self.placeholder.empty()
+    
+    def _tick(self):
+        while not self._stop.wait(self.interval):
+            elapsed = time.perf_counter() - self._start
+            self.placeholder.markdown(f"⏳ {elapsed:.1f}s — step: {self.step}")
+
+
+class ResultCache:
+    """Small thread-safe LRU of workflow results with a time-to-live."""
+    
+    def __init__(self, max_entries: int = 256, ttl: float = 3600):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (stored_at, result)
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, result = entry
+            if time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return result
+    
+    def put(self, key, result):
+        with self._lock:
+            self._entries[key] = (time.monotonic(), result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+@st.cache_resource
+def _result_cache():
+    """Workflow results keyed by (prompt, CSV version), shared by all sessions."""
+    return ResultCache()
+
+
+def _run_demo_questions(workflow, data_version, cache, limiter):
+    """Answer the sidebar demo questions into the result cache so demo clicks are instant."""
+    for question, _ in _DEMO_BUTTONS:
+        key = (question.strip(), data_version)
+        if cache.get(key) is not None:
+            continue
+        with limiter:
+            result = workflow.run(question)
+        if result["success"]:
+            cache.put(key, result)
+
+
+@st.cache_resource
+def prewarm_demo_results(_workflow, data_version=None):
+    """Queue the demo-question pre-warm once per CSV version (after background analysis)."""
+    if os.getenv("PREWARM_DEMO_QUESTIONS", "1") == "0":
         return None
+    return _bg_executor().submit(
+        _run_demo_questions, _workflow, data_version, _result_cache(), _workflow_limiter()
+    )
+
 
+@st.cache_data(show_spinner=False)
+def category_means(csv_path, data_version):
+    """Average score per category, reduced with np.bincount over the categorical codes."""
+    df = load_lifelog_data(csv_path, data_version)
+    categories = df['category'].cat.categories
+    codes = df['category'].cat.codes.to_numpy()
+    scores = df['mood_score'].to_numpy(np.float32)
+    
+    valid = codes >= 0  # -1 marks a missing category
+    sums = np.bincount(codes[valid], weights=scores[valid], minlength=len(categories))
+    counts = np.bincount(codes[valid], minlength=len(categories))
+    return {
+        category: float(sums[i] / counts[i])
+        for i, category in enumerate(categories)
+        if counts[i]
+    }
 
-def create_mood_timeline(df):
+
+@st.cache_data(show_spinner=False)
+def recent_entries(csv_path, data_version, n=15):
+    """Newest n lifelog entries for the Data Insights table."""
+    return load_lifelog_data(csv_path, data_version).nlargest(n, 'date')
+
+
+@st.cache_data(show_spinner=False)
+def _category_correlation(csv_path, data_version):
+    """Category x category correlation of daily scores as a small ndarray."""
+    from src.analytics import category_correlation
+    
+    df = load_lifelog_data(csv_path, data_version)
+    n = len(CATEGORIES)
+    
+    # Dense (n_dates, n_categories) matrix of daily mean scores, NaN where a day has no entry,
+    # built with one bincount over flat (date, category) cell indices
+    date_codes, dates = pd.factorize(df['date'])
+    column_of_code = np.array(
+        [CATEGORIES.index(c) if c in CATEGORIES else -1 for c in df['category'].cat.categories] + [-1]
+    )
+    columns = column_of_code[df['category'].cat.codes.to_numpy()]  # code -1 (missing) maps to -1
+    scores = df['mood_score'].to_numpy(np.float64)
+    valid = (columns >= 0) & (date_codes >= 0) & ~np.isnan(scores)
+    cells = date_codes[valid] * n + columns[valid]
+    sums = np.bincount(cells, weights=scores[valid], minlength=len(dates) * n)
+    counts = np.bincount(cells, minlength=len(dates) * n)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        wide = (sums / counts).reshape(len(dates), n)
+    
+    return category_correlation(wide)
+
+
+def create_mood_timeline(csv_path, data_version):
     """Create a timeline chart of mood scores."""
-    fig = px.line(df, x='date', y='mood_score', color='category',
-                  title='Lifelog Timeline - All Categories',
-                  labels={'mood_score': 'Score (1-5)', 'date': 'Date'},
-                  markers=True,
-                  color_discrete_map={
-                      'mood': '#76B900',
-                      'sleep': '#2196f3',
-                      'exercise': '#ff9800',
-                      'work': '#9c27b0'
-                  })
-    fig.update_layout(height=400, margin=dict(l=20, r=20, t=40, b=20))
+    import plotly.graph_objects as go
+    
+    df = load_lifelog_data(csv_path, data_version)
+    if len(df) > TIMELINE_MAX_POINTS:
+        # Downsample to daily means per category so the browser isn't sent every point
+        df = (
+            df.groupby([pd.Grouper(key='date', freq='D'), 'category'], observed=True)['mood_score']
+            .mean()
+            .dropna()
+            .reset_index()
+        )
+    
+    # One WebGL trace per category, fed numpy arrays directly (skips px's long-form machinery)
+    mode = 'lines+markers' if len(df) < TIMELINE_MARKER_LIMIT else 'lines'
+    fig = go.Figure()
+    for category, group in df.groupby('category', sort=False, observed=True):
+        fig.add_trace(go.Scattergl(
+            x=group['date'].to_numpy(),
+            y=group['mood_score'].to_numpy(),
+            mode=mode,
+            name=category,
+            line=dict(color=CATEGORY_COLORS.get(category))
+        ))
+    fig.update_layout(
+        title='Lifelog Timeline - All Categories',
+        xaxis_title='Date',
+        yaxis_title='Score (1-5)',
+        legend_title_text='category',
+        height=400,
+        margin=dict(l=20, r=20, t=40, b=20)
+    )
     return fig
 
 
-def create_category_summary(df):
+def create_category_summary(csv_path, data_version):
     """Create a summary chart by category."""
-    avg_by_category = df.groupby('category')['mood_score'].mean().reset_index()
-    fig = px.bar(avg_by_category, x='category', y='mood_score',
-                 title='Average Score by Category',
-                 labels={'mood_score': 'Average Score', 'category': 'Category'},
-                 color='category',
-                 color_discrete_map={
-                     'mood': '#76B900',
-                     'sleep': '#2196f3',
-                     'exercise': '#ff9800',
-                     'work': '#9c27b0'
-                 })
-    fig.update_layout(height=400, margin=dict(l=20, r=20, t=40, b=20), showlegend=False)
+    import plotly.graph_objects as go
+    
+    means = category_means(csv_path, data_version)
+    categories = list(means)
+    fig = go.Figure(go.Bar(
+        x=categories,
+        y=np.fromiter(means.values(), dtype=np.float32, count=len(means)),
+        marker_color=[CATEGORY_COLORS.get(category) for category in categories]
+    ))
+    fig.update_layout(
+        title='Average Score by Category',
+        xaxis_title='Category',
+        yaxis_title='Average Score',
+        height=400,
+        margin=dict(l=20, r=20, t=40, b=20),
+        showlegend=False
+    )
     return fig
 
 
-def create_correlation_heatmap(df):
+def create_correlation_heatmap(csv_path, data_version):
     """Create a correlation heatmap showing relationships between categories."""
-    # Pivot to get categories as columns
-    pivot_df = df.pivot_table(index='date', columns='category', values='mood_score')
+    import plotly.graph_objects as go
     
-    # Calculate correlation
-    corr = pivot_df.corr()
+    corr = _category_correlation(csv_path, data_version)
     
     fig = go.Figure(data=go.Heatmap(
-        z=corr.values,
-        x=corr.columns,
-        y=corr.columns,
+        z=np.asarray(corr, dtype=np.float32),
+        x=CATEGORIES,
+        y=CATEGORIES,
         colorscale='RdYlGn',
         zmid=0
     ))
@@ -221,26 +569,189 @@ def create_correlation_heatmap(df):
     return fig
 
 
+@st.cache_resource(show_spinner=False)
+def _cached_figure(builder, csv_path, data_version):
+    """Build a chart once per data version; reruns share the figure with no pickling or rebuild."""
+    return builder(csv_path, data_version)
+
+
+def render_figure(builder, csv_path, data_version):
+    """Render a cached chart with the plotly.js that Streamlit's frontend already ships."""
+    st.plotly_chart(_cached_figure(builder, csv_path, data_version), width='stretch')
+
+
+# Step-title keyword -> extra CSS class (first match wins)
+_STEP_CLASSES = {
+    "Safety": "reasoning-step safety-check",
+    "ReAct": "reasoning-step react-cycle",
+    "Synthesis": "reasoning-step synthesis",
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _render_step_html(step_text, description):
+    """Build the styled HTML for one reasoning step (memoized across reruns)."""
+    css_class = next((cls for key, cls in _STEP_CLASSES.items() if key in step_text), "reasoning-step")
+    # Single unindented line: indented HTML after a blank line would be parsed as a markdown code block
+    return (
+        f'<div class="{css_class}"><span class="step-title">{html.escape(step_text)}</span>'
+        f'<br/>{html.escape(description)}</div>'
+    )
+
+
 def render_reasoning_step(step):
     """Render a reasoning step with appropriate styling."""
-    step_text = step['step']
-    description = step['description']
-    
-    # Determine CSS class based on step type
-    css_class = "reasoning-step"
-    if "Safety" in step_text:
-        css_class += " safety-check"
-    elif "ReAct" in step_text:
-        css_class += " react-cycle"
-    elif "Synthesis" in step_text:
-        css_class += " synthesis"
-    
-    return f"""
-    <div class="{css_class}">
-        <span class="step-title">{step_text}</span><br/>
-        {description}
-    </div>
+    return _render_step_html(step['step'], step['description'])
+
+
+# Progress labels shown while each workflow graph node runs
+WORKFLOW_NODE_LABELS = {
+    "safety_check_input": "🛡️ Checking input safety",
+    "prefetch_data": "📥 Prefetching lifelog data",
+    "react_reason": "🧠 Reasoning",
+    "react_act": "🔍 Retrieving data",
+    "react_observe": "👁️ Observing results",
+    "synthesize_response": "✍️ Synthesizing response",
+    "safety_check_output": "🛡️ Validating response",
+}
+
+# Minimum seconds between live progress redraws while a workflow streams (~10 Hz)
+STREAM_FLUSH_INTERVAL = 0.1
+
+# Top-level views (radio labels)
+VIEWS = ["💬 Chat Interface", "📊 Data Insights", "🔬 System Info"]
+
+# Chat turns rendered eagerly; older history is revealed a window at a time
+RECENT_MESSAGES = 20
+# Hard cap on stored history; the oldest turns are evicted beyond this
+MAX_HISTORY_MESSAGES = 50
+
+ARCHITECTURE_SVG = "docs/architecture.svg"
+
+ARCHITECTURE_MERMAID = """\
+flowchart LR
+    classDef ioNode fill:#ffe0e0,stroke:#d32f2f,stroke-width:2px;
+
+    Question([User question]):::ioNode --> SafetyIn
+
+    subgraph System["Agentic Insight Pipeline"]
+        subgraph Capture["1. Capture & Store"]
+            UserData[User data streams] --> Normalize[Normalize & tag]
+            Normalize --> VectorDB[Vector DB]
+            Normalize --> Metadata[Metadata]
+        end
+
+        subgraph Background["2. Background Analysis"]
+            VectorDB --> AnalysisAgent[Analysis agent]
+            Metadata --> AnalysisAgent
+            AnalysisAgent --> KPIStore[KPI store]
+            KPIStore --> CoachAgent[Coach agent]
+            CoachAgent --> InsightsCache[Insights cache]
+        end
+
+        subgraph Conversation["3. Conversational Coach"]
+            SafetyIn --> Orchestrator[ReAct orchestrator]
+            Orchestrator --> Retrieval[Search vector DB]
+            Retrieval --> Orchestrator
+            Orchestrator --> InsightsTool[Query insights cache]
+            InsightsTool --> Orchestrator
+            Orchestrator --> Synthesis[Synthesize answer]
+            Synthesis --> SafetyOut[Safety check out]
+        end
+    end
+
+    VectorDB -.-> Retrieval
+    InsightsCache -.-> InsightsTool
+
+    SafetyOut --> Response([Coach response]):::ioNode
+"""
+
+# Pre-escaped once at import so the expander skips Streamlit's code highlighter
+_ARCHITECTURE_MERMAID_HTML = f'<pre style="font-family: monospace; white-space: pre;">{html.escape(ARCHITECTURE_MERMAID)}</pre>'
+
+
+def render_reasoning_steps(steps):
+    """Render a list of reasoning steps as one HTML string."""
+    return "\n".join(render_reasoning_step(step) for step in steps)
+
+
+def safety_check_rows(checks):
+    """Flatten safety check results into table rows (built once per message)."""
+    return [
+        {
+            "Check": check.get("type", "unknown").upper(),
+            "Result": "✅ Passed" if check.get("is_safe", True) else "⚠️ Flagged",
+            "Category": check.get("category", "N/A"),
+        }
+        for check in checks
+    ]
+
+
+def render_safety_checks(rows):
+    """Render safety check rows as one compact HTML table for the history log."""
+    if not rows:
+        return ""
+    body = "".join(
+        f"<tr><td>{html.escape(str(row['Check']))}</td><td>{html.escape(str(row['Result']))}</td>"
+        f"<td>{html.escape(str(row['Category']))}</td></tr>"
+        for row in rows
+    )
+    return f"<table><tr><th>Check</th><th>Result</th><th>Category</th></tr>{body}</table>"
+
+
+def _build_message_payload(result, elapsed):
+    """Pre-render an assistant reply once into the display payload stored in the chat history."""
+    safety_rows = safety_check_rows(result.get("safety_checks", []))
+    metrics = {
+        "react_cycles": result.get("react_cycles", 0),
+        "retrieved_entries": result.get("retrieved_entries", 0),
+        "safety_checks": result.get("safety_checks", []),
+        "elapsed_time": elapsed,
+    }
+    return {
+        "role": "assistant",
+        "content": result["response"],
+        "metrics_html": render_response_metrics(metrics),
+        "reasoning_html": render_reasoning_steps(result.get("reasoning_steps", [])),
+        "safety_rows": safety_rows,
+        "safety_html": render_safety_checks(safety_rows),
+    }
+
+
+@st.cache_resource
+def _markdown_renderer():
+    """Markdown renderer for chat text, with raw HTML disabled (the same syntax st.markdown formats)."""
+    from markdown_it import MarkdownIt
+    
+    return MarkdownIt("js-default")
+
+
+def render_message_html(message):
+    """Render one chat message (bubble, metrics, collapsed reasoning and safety report) as HTML.
+
+    The text comes from the user or the LLM, so its markdown is rendered here
+    with raw HTML disabled: formatting survives, while any HTML in it is escaped.
     """
+    role = message["role"]
+    parts = [
+        f'<div class="chat-bubble chat-{role}">',
+        _markdown_renderer().render(message["content"]),
+    ]
+    if message.get("metrics_html"):
+        parts.append(message["metrics_html"])
+    if message.get("reasoning_html"):
+        parts.append(f"<details><summary>🔍 View Multi-Agent Reasoning Process</summary>\n\n{message['reasoning_html']}\n\n</details>")
+    if message.get("safety_html"):
+        parts.append(f"<details><summary>🛡️ Safety Guardrails Report</summary>\n\n{message['safety_html']}\n\n</details>")
+    parts.append("</div>")
+    return "\n\n".join(parts)
+
+
+def append_message(message):
+    """Add a message to the chat history and its pre-rendered HTML to the render log."""
+    messages, rendered = st.session_state.messages, st.session_state.rendered_html
+    messages.append(message)
+    rendered.append(render_message_html(message))
 
 
 def get_demo_questions():
@@ -255,50 +766,182 @@ def get_demo_questions():
     ]
 
 
+# (question, button label) for the sidebar demo buttons, built once at import
+_DEMO_BUTTONS = [(question, f"💡 {question[:35]}...") for question in get_demo_questions()[:4]]
+
+
+@st.fragment
+def chat_panel(workflow, data_key):
+    """Render the chat tab as a fragment so a chat turn reruns only this panel."""
+    # Main chat interface
+    st.header("Ask Your Personal AI Coach")
+    
+    # Initialize chat history (messages plus an append-only log of their rendered HTML)
+    if "messages" not in st.session_state:
+        st.session_state.messages = deque(maxlen=MAX_HISTORY_MESSAGES)
+        st.session_state.rendered_html = deque(maxlen=MAX_HISTORY_MESSAGES)
+        # Add welcome message
+        append_message({
+            "role": "assistant",
+            "content": """👋 **Hello! I'm your Agentic AI Coach.**
+
+I can analyze your lifelog data using advanced multi-agent reasoning to provide deep insights about your:
+- 😴 Sleep patterns and quality
+- 🏃 Exercise habits and energy levels  
+- 💼 Work productivity patterns
+- 😊 Mood trends and correlations
+
+**I use a sophisticated ReAct (Reasoning + Action) pattern with safety guardrails to ensure accurate, helpful, and safe responses.**
+
+Try asking me a question, or click a demo button in the sidebar!"""
+        })
+    elif "rendered_html" not in st.session_state:
+        st.session_state.rendered_html = deque(
+            map(render_message_html, st.session_state.messages),
+            maxlen=MAX_HISTORY_MESSAGES
+        )
+    
+    # Check for demo question
+    if hasattr(st.session_state, 'demo_question'):
+        prompt = st.session_state.demo_question
+        del st.session_state.demo_question
+    else:
+        prompt = None
+    
+    # Display chat history in one markdown flush: the newest `history_window` turns,
+    # with earlier ones revealed a window at a time
+    rendered = st.session_state.rendered_html
+    window = st.session_state.get("history_window", RECENT_MESSAGES)
+    hidden = len(rendered) - window
+    if hidden > 0:
+        if st.button(f"Show earlier messages ({hidden} hidden)", key="show_older"):
+            st.session_state.history_window = window + RECENT_MESSAGES
+            st.rerun(scope="fragment")
+        rendered = itertools.islice(rendered, hidden, None)
+    st.markdown("\n\n".join(rendered), unsafe_allow_html=True)
+    
+    # Chat input
+    user_input = prompt if prompt else st.chat_input("Ask me anything about your lifelog data...")
+    
+    if user_input:
+        # Add user message to chat
+        append_message({"role": "user", "content": user_input})
+        
+        # Display user message
+        with st.chat_message("user"):
+            st.markdown(user_input)
+        
+        # Generate response, streaming each graph node's progress as it completes
+        with st.chat_message("assistant"):
+            status = st.status("🤔 Multi-agent system analyzing your data...", expanded=True)
+            stopwatch_placeholder = status.empty()
+            steps_placeholder = status.empty()
+            # Slots for the answer are allocated up front and filled in place
+            response_placeholder, metrics_placeholder, safety_placeholder = st.empty(), st.empty(), st.empty()
+            start_time = time.perf_counter()
+            # Repeated questions (e.g. demo buttons) against the same data are answered from cache
+            cache_key = (user_input.strip(), data_key[1])
+            result = _result_cache().get(cache_key)
+            if result is None:
+                last_flush = 0.0
+                # Start timing before taking a slot, so the display includes any queue wait
+                with LiveStopwatch(stopwatch_placeholder, step="Waiting for a free slot") as stopwatch, _workflow_limiter():
+                    stopwatch.step = "Starting"
+                    for event in workflow.stream(user_input):
+                        if event["type"] != "intermediate":
+                            result = event
+                            break
+                        node_label = WORKFLOW_NODE_LABELS.get(event["node"], event["node"])
+                        stopwatch.step = node_label
+                        # Throttle UI updates; fast nodes (e.g. cached lookups) would otherwise flood the frontend
+                        now = time.monotonic()
+                        if now - last_flush < STREAM_FLUSH_INTERVAL:
+                            continue
+                        last_flush = now
+                        status.update(label=f"🤔 {node_label} (ReAct cycle {event['iteration_count']})")
+                        steps_placeholder.markdown(render_reasoning_steps(event["reasoning_steps"]), unsafe_allow_html=True)
+                if result is not None and result["success"]:
+                    _result_cache().put(cache_key, result)
+            elapsed_time = time.perf_counter() - start_time
+            
+            if result is not None and result["success"]:
+                # Render the display payload once; the history log reuses it on later reruns
+                payload = _build_message_payload(result, elapsed_time)
+                append_message(payload)
+                
+                # The live status box becomes the reasoning view
+                steps_placeholder.markdown(payload["reasoning_html"], unsafe_allow_html=True)
+                status.update(label="🔍 View Multi-Agent Reasoning Process", state="complete", expanded=False)
+                
+                response_placeholder.markdown(result["response"])
+                
+                # Show metrics
+                metrics_placeholder.markdown(payload["metrics_html"], unsafe_allow_html=True)
+                
+                # Show safety checks details
+                if payload["safety_rows"]:
+                    with safety_placeholder.container():
+                        with st.expander("🛡️ Safety Guardrails Report", expanded=False):
+                            st.dataframe(payload["safety_rows"], hide_index=True, width='stretch')
+            else:
+                status.update(label="❌ Analysis failed", state="error", expanded=False)
+                error = result.get('error', 'Unknown error') if result else 'Unknown error'
+                error_msg = f"❌ Sorry, I encountered an error: {error}"
+                response_placeholder.error(error_msg)
+                append_message({
+                    "role": "assistant",
+                    "content": error_msg
+                })
+
+
 def main():
     """Main application entry point."""
+    _inject_css()
     
     # Header
     st.markdown('<div class="main-header">🧠 Agentic Lifelog</div>', unsafe_allow_html=True)
     st.markdown('<div class="sub-header">Your Personal AI Coach powered by NVIDIA Nemotron Multi-Agent System</div>', unsafe_allow_html=True)
     
     # Demo banner
-    st.markdown("""
-    <div class="demo-banner">
-        🏆 NVIDIA GTC Hackathon 2025 - Nemotron Prize Track POC Demo<br/>
-        Showcasing: ReAct Pattern • Multi-Agent Orchestration • Safety Guardrails • Agentic RAG
-    </div>
-    """, unsafe_allow_html=True)
+    st.components.v1.html(_DEMO_BANNER_HTML, height=80, scrolling=False)
     
     # Initialize system
-    workflow, data_store, stats = initialize_system()
-    df = load_lifelog_data()
+    data_key = lifelog_data_key()
+    workflow, data_store, stats = initialize_system(*data_key)
+    prewarm_demo_results(workflow, data_key[1])
+    df = load_lifelog_data(*data_key)
     
     # Sidebar
     with st.sidebar:
-        st.image("https://www.nvidia.com/content/dam/en-zz/Solutions/about-nvidia/logo-and-brand/01-nvidia-logo-vert-500x200-2c50-d@2x.png", width=150)
+        st.image(_logo_image(), width=150)
         
         st.markdown("---")
         
         st.header("🎯 Quick Demo")
         
         # Demo questions buttons
-        demo_questions = get_demo_questions()
         st.write("**Click to try:**")
-        for i, question in enumerate(demo_questions[:4]):
-            if st.button(f"💡 {question[:35]}...", key=f"demo_{i}", width='stretch'):
+        for i, (question, label) in enumerate(_DEMO_BUTTONS):
+            if st.button(label, key=f"demo_{i}", width='stretch'):
                 st.session_state.demo_question = question
         
         st.markdown("---")
         
         st.header("📊 System Status")
         
-        st.markdown(f"""
-        <div class="stat-box">
-            <h3>{stats['total_entries']}</h3>
-            <p>Lifelog Entries</p>
-        </div>
-        """, unsafe_allow_html=True)
+        with st.container(border=True):
+            st.metric("📚 Lifelog Entries", stats['total_entries'])
+        
+        insights_future = start_background_analysis(data_store, data_key[1])
+        if not insights_future.done():
+            st.caption("🔄 Background analysis running...")
+        elif insights_future.exception() is not None:
+            st.caption("⚠️ Background analysis failed - using previous insights")
+        else:
+            st.caption("✅ Background insights ready")
+        
+        limiter = _workflow_limiter()
+        st.caption(f"⚙️ Active queries: {min(limiter.in_flight, limiter.limit)}/{limiter.limit} · queued: {limiter.queued}")
         
         st.markdown("---")
         
@@ -330,166 +973,22 @@ def main():
         - Agentic RAG Pattern
         """)
     
-    # Create tabs for different views
-    tab1, tab2, tab3 = st.tabs(["💬 Chat Interface", "📊 Data Insights", "🔬 System Info"])
+    # View selector: unlike st.tabs, only the active view's body runs on a rerun
+    view = st.radio(
+        "View", VIEWS, horizontal=True, key="active_view", label_visibility="collapsed"
+    )
     
-    with tab1:
-        # Main chat interface
-        st.header("Ask Your Personal AI Coach")
-        
-        # Initialize chat history
-        if "messages" not in st.session_state:
-            st.session_state.messages = []
-            # Add welcome message
-            st.session_state.messages.append({
-                "role": "assistant",
-                "content": """👋 **Hello! I'm your Agentic AI Coach.**
-
-I can analyze your lifelog data using advanced multi-agent reasoning to provide deep insights about your:
-- 😴 Sleep patterns and quality
-- 🏃 Exercise habits and energy levels  
-- 💼 Work productivity patterns
-- 😊 Mood trends and correlations
-
-**I use a sophisticated ReAct (Reasoning + Action) pattern with safety guardrails to ensure accurate, helpful, and safe responses.**
-
-Try asking me a question, or click a demo button in the sidebar!"""
-            })
-        
-        # Check for demo question
-        if hasattr(st.session_state, 'demo_question'):
-            prompt = st.session_state.demo_question
-            del st.session_state.demo_question
-        else:
-            prompt = None
-        
-        # Display chat history
-        for message in st.session_state.messages:
-            with st.chat_message(message["role"]):
-                st.markdown(message["content"])
-                
-                # Display detailed metrics if present
-                if "react_cycles" in message or "retrieved_entries" in message:
-                    cols = st.columns(4)
-                    if "react_cycles" in message:
-                        cols[0].metric("🔄 ReAct Cycles", message.get("react_cycles", 0))
-                    if "retrieved_entries" in message:
-                        cols[1].metric("📊 Entries Retrieved", message.get("retrieved_entries", 0))
-                    if "safety_checks" in message:
-                        cols[2].metric("🛡️ Safety Checks", len(message.get("safety_checks", [])))
-                    if "elapsed_time" in message:
-                        cols[3].metric("⏱️ Response Time", f"{message.get('elapsed_time', 0):.2f}s")
-                
-                # Display reasoning steps if present
-                if "reasoning_steps" in message and message["reasoning_steps"]:
-                    with st.expander("🔍 View Multi-Agent Reasoning Process", expanded=False):
-                        for step in message["reasoning_steps"]:
-                            st.markdown(render_reasoning_step(step), unsafe_allow_html=True)
-                
-                # Display safety checks if present
-                if "safety_checks" in message and message["safety_checks"]:
-                    with st.expander("🛡️ Safety Guardrails Report", expanded=False):
-                        for check in message["safety_checks"]:
-                            check_type = check.get("type", "unknown")
-                            is_safe = check.get("is_safe", True)
-                            icon = "✅" if is_safe else "⚠️"
-                            st.markdown(f"{icon} **{check_type.upper()} Check**: {'Passed' if is_safe else 'Flagged'} - Category: {check.get('category', 'N/A')}")
-        
-        # Chat input
-        user_input = prompt if prompt else st.chat_input("Ask me anything about your lifelog data...")
-        
-        if user_input:
-            # Add user message to chat
-            st.session_state.messages.append({"role": "user", "content": user_input})
-            
-            # Display user message
-            with st.chat_message("user"):
-                st.markdown(user_input)
-            
-            # Generate response
-            with st.chat_message("assistant"):
-                with st.spinner("🤔 Multi-agent system analyzing your data..."):
-                    start_time = datetime.now()
-                    result = workflow.run(user_input)
-                    elapsed_time = (datetime.now() - start_time).total_seconds()
-                
-                if result["success"]:
-                    st.markdown(result["response"])
-                    
-                    # Show metrics
-                    cols = st.columns(4)
-                    cols[0].metric("🔄 ReAct Cycles", result.get("react_cycles", 0))
-                    cols[1].metric("📊 Entries Retrieved", result.get("retrieved_entries", 0))
-                    cols[2].metric("🛡️ Safety Checks", len(result.get("safety_checks", [])))
-                    cols[3].metric("⏱️ Response Time", f"{elapsed_time:.2f}s")
-                    
-                    # Store assistant message with reasoning
-                    st.session_state.messages.append({
-                        "role": "assistant",
-                        "content": result["response"],
-                        "reasoning_steps": result.get("reasoning_steps", []),
-                        "safety_checks": result.get("safety_checks", []),
-                        "react_cycles": result.get("react_cycles", 0),
-                        "retrieved_entries": result.get("retrieved_entries", 0),
-                        "elapsed_time": elapsed_time
-                    })
-                    
-                    # Show reasoning steps
-                    with st.expander("🔍 View Multi-Agent Reasoning Process", expanded=True):
-                        for step in result["reasoning_steps"]:
-                            st.markdown(render_reasoning_step(step), unsafe_allow_html=True)
-                    
-                    # Show safety checks details
-                    if result.get("safety_checks"):
-                        with st.expander("🛡️ Safety Guardrails Report", expanded=False):
-                            for check in result["safety_checks"]:
-                                check_type = check.get("type", "unknown")
-                                is_safe = check.get("is_safe", True)
-                                icon = "✅" if is_safe else "⚠️"
-                                st.markdown(f"{icon} **{check_type.upper()} Check**: {'Passed' if is_safe else 'Flagged'} - Category: {check.get('category', 'N/A')}")
-                else:
-                    error_msg = f"❌ Sorry, I encountered an error: {result.get('error', 'Unknown error')}"
-                    st.error(error_msg)
-                    st.session_state.messages.append({
-                        "role": "assistant",
-                        "content": error_msg
-                    })
-    
-    with tab2:
+    if view == VIEWS[0]:
+        chat_panel(workflow, data_key)
+    
+    elif view == VIEWS[1]:
         # Data visualization tab
         st.header("📊 Your Lifelog Data Insights")
         
         if df is not None:
             # Summary stats
-            col1, col2, col3, col4 = st.columns(4)
-            with col1:
-                st.markdown("""
-                <div class="metric-card">
-                    <h3 style="color: #2196f3;">😴</h3>
-                    <p><b style="font-size: 2rem;">{:.1f}</b><br/>Avg Sleep Score</p>
-                </div>
-                """.format(df[df['category']=='sleep']['mood_score'].mean()), unsafe_allow_html=True)
-            with col2:
-                st.markdown("""
-                <div class="metric-card">
-                    <h3 style="color: #ff9800;">🏃</h3>
-                    <p><b style="font-size: 2rem;">{:.1f}</b><br/>Avg Exercise Score</p>
-                </div>
-                """.format(df[df['category']=='exercise']['mood_score'].mean()), unsafe_allow_html=True)
-            with col3:
-                st.markdown("""
-                <div class="metric-card">
-                    <h3 style="color: #9c27b0;">💼</h3>
-                    <p><b style="font-size: 2rem;">{:.1f}</b><br/>Avg Work Score</p>
-                </div>
-                """.format(df[df['category']=='work']['mood_score'].mean()), unsafe_allow_html=True)
-            with col4:
-                st.markdown("""
-                <div class="metric-card">
-                    <h3 style="color: #76B900;">😊</h3>
-                    <p><b style="font-size: 2rem;">{:.1f}</b><br/>Avg Mood Score</p>
-                </div>
-                """.format(df[df['category']=='mood']['mood_score'].mean()), unsafe_allow_html=True)
+            means = category_means(*data_key)
+            render_metric_cards(means)
             
             st.markdown("---")
             
@@ -497,29 +996,29 @@ Try asking me a question, or click a demo button in the sidebar!"""
             col1, col2 = st.columns(2)
             
             with col1:
-                st.plotly_chart(create_mood_timeline(df), width='stretch')
+                render_figure(create_mood_timeline, *data_key)
             
             with col2:
-                st.plotly_chart(create_category_summary(df), width='stretch')
+                render_figure(create_category_summary, *data_key)
             
             st.markdown("---")
             
             # Correlation heatmap
-            st.plotly_chart(create_correlation_heatmap(df), width='stretch')
+            render_figure(create_correlation_heatmap, *data_key)
             
             st.markdown("---")
             
             # Recent entries
             st.subheader("📝 Recent Lifelog Entries")
             st.dataframe(
-                df.sort_values('date', ascending=False).head(15),
+                recent_entries(*data_key),
                 width='stretch',
                 hide_index=True
             )
         else:
             st.error("Unable to load data for visualization")
     
-    with tab3:
+    else:
         # System information tab
         st.header("🔬 Agentic System Architecture")
         
@@ -531,56 +1030,11 @@ Try asking me a question, or click a demo button in the sidebar!"""
         Background Analysis & Coaching agents process historical data asynchronously to provide KPI-driven insights to the ReAct workflow.
         """)
         
-        mermaid_diagram = """
-        <div style='width:100%; background:#ffffff; border-radius:12px; padding:16px; box-shadow:0 0 12px rgba(0,0,0,0.05);'>
-            <pre class='mermaid' style='min-height:520px;'>
-flowchart LR
-    classDef ioNode fill:#ffe0e0,stroke:#d32f2f,stroke-width:2px;
-
-    Question([User question]):::ioNode --> SafetyIn
-
-    subgraph System["Agentic Insight Pipeline"]
-        subgraph Capture["1. Capture & Store"]
-            UserData[User data streams] --> Normalize[Normalize & tag]
-            Normalize --> VectorDB[Vector DB]
-            Normalize --> Metadata[Metadata]
-        end
-
-        subgraph Background["2. Background Analysis"]
-            VectorDB --> AnalysisAgent[Analysis agent]
-            Metadata --> AnalysisAgent
-            AnalysisAgent --> KPIStore[KPI store]
-            KPIStore --> CoachAgent[Coach agent]
-            CoachAgent --> InsightsCache[Insights cache]
-        end
-
-        subgraph Conversation["3. Conversational Coach"]
-            SafetyIn --> Orchestrator[ReAct orchestrator]
-            Orchestrator --> Retrieval[Search vector DB]
-            Retrieval --> Orchestrator
-            Orchestrator --> InsightsTool[Query insights cache]
-            InsightsTool --> Orchestrator
-            Orchestrator --> Synthesis[Synthesize answer]
-            Synthesis --> SafetyOut[Safety check out]
-        end
-    end
-
-    VectorDB -.-> Retrieval
-    InsightsCache -.-> InsightsTool
-
-    SafetyOut --> Response([Coach response]):::ioNode
-            </pre>
-        </div>
-        <script src='https://cdn.jsdelivr.net/npm/mermaid@10/dist/mermaid.min.js'></script>
-        <script>
-            if (window.mermaid) {
-                mermaid.initialize({ startOnLoad: false, theme: 'default' });
-                mermaid.init(undefined, document.querySelectorAll('.mermaid'));
-            }
-        </script>
-        """
-
-        st.components.v1.html(mermaid_diagram, height=640, scrolling=False)
+        # Static rendering of ARCHITECTURE_MERMAID; keep the two in sync when the pipeline changes
+        st.image(ARCHITECTURE_SVG, width='stretch')
+        
+        with st.expander("Mermaid source", expanded=False):
+            st.markdown(_ARCHITECTURE_MERMAID_HTML, unsafe_allow_html=True)
         
         st.markdown("---")
         
@@ -755,13 +1209,7 @@ flowchart LR
     
     # Footer
     st.markdown("---")
-    st.markdown("""
-    <div style="text-align: center; color: #999; font-size: 0.85rem;">
-        <b>🏆 Built for NVIDIA GTC Hackathon 2025 - Nemotron Prize Track</b><br/>
-        Demonstrating agentic AI with ReAct pattern, multi-agent orchestration, safety guardrails, and tool integration<br/>
-        <i>Powered by NVIDIA Nemotron Super 49B v1.5 & Nemotron Safety Guard 8B v3</i>
-    </div>
-    """, unsafe_allow_html=True)
+    st.components.v1.html(_FOOTER_HTML, height=80, scrolling=False)
 
 
 if __name__ == "__main__":
@@ -1,52 +1,77 @@
 """Chat API endpoints including WebSocket support."""
-from typing import List, Optional
-from datetime import datetime
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect, HTTPException, Depends
-from fastapi.responses import JSONResponse, StreamingResponse
-import json
+from typing import Deque, List, Optional
+from datetime import datetime, timedelta
+from collections import deque
+from itertools import islice
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect, HTTPException, Request
+from fastapi.responses import StreamingResponse
 import asyncio
+import functools
+import time
+import orjson
 
-from backend.models.schemas import ChatRequest, ChatResponse, ChatMessage, WSMessage
+from backend.models.schemas import ChatRequest, ChatResponse, ChatMessage
 from backend.services.workflow import WorkflowService
 
 router = APIRouter()
 
+# Maximum number of messages kept in memory; the oldest are evicted first
+MAX_CHAT_HISTORY = 1000
+
+# Messages a WebSocket client may queue while a response is still streaming
+WS_INBOX_SIZE = 4
+
+# Workflow state fields forwarded in SSE intermediate events (what the frontend consumes)
+SSE_STATE_FIELDS = ("response", "reasoning_steps", "safety_checks", "iteration_count")
+
+# SSE frame delimiters
+SSE_PREFIX = b"data: "
+SSE_SEP = b"\n\n"
+SSE_DONE = SSE_PREFIX + b'{"type":"done"}' + SSE_SEP
+
 # In-memory chat history (in production, use a database)
-chat_history: List[ChatMessage] = []
+chat_history: Deque[ChatMessage] = deque(maxlen=MAX_CHAT_HISTORY)
+
+
+async def send_ws_json(websocket: WebSocket, payload: dict):
+    """Send a JSON text frame encoded with orjson (C-level encoder, no stdlib json pass)."""
+    await websocket.send_text(
+        orjson.dumps(
+            payload, default=str, option=orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY
+        ).decode()
+    )
 
 
-async def get_workflow_service():
-    """Dependency to get workflow service."""
-    from backend.main import app
-    return WorkflowService(app.state.workflow)
+def error_event(content: str) -> dict:
+    """Build a WebSocket error event with the same fields as WSMessage."""
+    return {"type": "error", "content": content, "reasoning_step": None, "metrics": None}
 
 
 @router.post("/message", response_model=ChatResponse)
-async def send_message(
-    request: ChatRequest,
-    workflow_service: WorkflowService = Depends(get_workflow_service)
-):
+async def send_message(request: ChatRequest, http_request: Request):
     """Process a chat message and return response."""
+    workflow_service: WorkflowService = http_request.app.state.workflow_service
     try:
         # Add user message to history
+        received_at = datetime.now()
         user_message = ChatMessage(
             role="user",
             content=request.message,
-            timestamp=datetime.now()
+            timestamp=received_at
         )
         chat_history.append(user_message)
         
         # Process message through workflow
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         result = await workflow_service.process_message(request.message)
-        elapsed_time = (datetime.now() - start_time).total_seconds()
+        elapsed_time = time.perf_counter() - start_time
         
         if result["success"]:
             # Add assistant message to history
             assistant_message = ChatMessage(
                 role="assistant",
                 content=result["response"],
-                timestamp=datetime.now(),
+                timestamp=received_at + timedelta(seconds=elapsed_time),
                 reasoning_steps=result.get("reasoning_steps", []),
                 safety_checks=result.get("safety_checks", []),
                 metrics={
@@ -78,8 +103,8 @@ async def send_message(
 async def get_chat_history(limit: Optional[int] = None):
     """Get chat history."""
     if limit:
-        return chat_history[-limit:]
-    return chat_history
+        return list(islice(chat_history, max(0, len(chat_history) - limit), None))
+    return list(chat_history)
 
 
 @router.delete("/history")
@@ -90,24 +115,46 @@ async def clear_chat_history():
 
 
 @router.websocket("/ws")
-async def websocket_endpoint(
-    websocket: WebSocket,
-    workflow_service: WorkflowService = Depends(get_workflow_service)
-):
+async def websocket_endpoint(websocket: WebSocket):
     """WebSocket endpoint for streaming chat responses."""
+    workflow_service: WorkflowService = websocket.app.state.workflow_service
+    send = functools.partial(send_ws_json, websocket)
     await websocket.accept()
     
+    # Receive on a separate task so the client can queue its next message
+    # while the current one is still streaming
+    inbox: asyncio.Queue = asyncio.Queue(maxsize=WS_INBOX_SIZE)
+    
+    async def reader():
+        try:
+            while True:
+                await inbox.put(await websocket.receive_json())
+        except WebSocketDisconnect:
+            pass
+        except Exception as e:
+            print(f"WebSocket error: {e}")
+        finally:
+            # Wake the consumer with None; drop pending messages if the inbox is full
+            while True:
+                try:
+                    inbox.put_nowait(None)
+                    break
+                except asyncio.QueueFull:
+                    inbox.get_nowait()
+    
+    reader_task = asyncio.create_task(reader())
+    
     try:
         while True:
-            # Receive message from client
-            data = await websocket.receive_json()
+            # Next message from the client (None once it has disconnected)
+            data = await inbox.get()
+            if data is None:
+                print("WebSocket disconnected")
+                break
             message = data.get("message", "")
             
             if not message:
-                await websocket.send_json({
-                    "type": "error",
-                    "content": "No message provided"
-                })
+                await send(error_event("No message provided"))
                 continue
             
             # Add user message to history
@@ -121,13 +168,13 @@ async def websocket_endpoint(
             # Stream the workflow execution
             try:
                 async for event in workflow_service.stream_message(message):
-                    ws_message = WSMessage(
-                        type=event["type"],
-                        content=event.get("content"),
-                        reasoning_step=event.get("reasoning_step"),
-                        metrics=event.get("metrics")
-                    )
-                    await websocket.send_json(ws_message.dict())
+                    # Same shape as WSMessage, built directly from the pass-through event
+                    await send({
+                        "type": event["type"],
+                        "content": event.get("content"),
+                        "reasoning_step": event.get("reasoning_step"),
+                        "metrics": event.get("metrics")
+                    })
                     
                     # If this is the final message, add to history
                     if event["type"] == "final" and event.get("success"):
@@ -146,68 +193,57 @@ async def websocket_endpoint(
                         chat_history.append(assistant_message)
                         
             except Exception as e:
-                error_message = WSMessage(
-                    type="error",
-                    content=f"Error processing message: {str(e)}"
-                )
-                await websocket.send_json(error_message.dict())
+                await send(error_event(f"Error processing message: {str(e)}"))
                 
     except WebSocketDisconnect:
         print("WebSocket disconnected")
     except Exception as e:
         print(f"WebSocket error: {e}")
         await websocket.close()
+    finally:
+        reader_task.cancel()
 
 
 @router.post("/stream")
-async def stream_chat(
-    request: ChatRequest,
-    workflow_service: WorkflowService = Depends(get_workflow_service)
-):
+async def stream_chat(request: ChatRequest, http_request: Request):
     """Stream chat response using Server-Sent Events."""
+    workflow_service: WorkflowService = http_request.app.state.workflow_service
     
     async def event_generator():
+        workflow = workflow_service.workflow
+        state = {}
         try:
             # Stream the LangGraph execution
-            async for event in workflow_service.workflow.graph.astream({
-                "query": request.message,
-                "reasoning_steps": [],
-                "safety_checks": [],
-                "react_context": {},
-                "observations": [],
-                "iteration_count": 0,
-                "should_continue": True
-            }):
-                # Send each event as SSE
-                node_name = list(event.keys())[0]
-                node_data = event[node_name]
+            async for event in workflow.graph.astream(workflow.initial_state(request.message)):
+                # Nodes emit deltas (lists are appended by reducers), so accumulate them
+                node_name = next(iter(event))
+                workflow.merge_update(state, event[node_name])
+                
+                # Send each event as SSE, keeping only the fields the UI reads
+                slim = {k: state[k] for k in SSE_STATE_FIELDS if k in state}
                 
-                data = json.dumps({
+                yield SSE_PREFIX + orjson.dumps({
                     "type": "intermediate",
                     "node": node_name,
-                    "data": node_data
-                })
-                yield f"data: {data}\n\n"
-                
-                # Small delay to prevent overwhelming the client
-                await asyncio.sleep(0.01)
+                    "data": slim
+                }, option=orjson.OPT_SERIALIZE_NUMPY) + SSE_SEP
             
             # Send final event
-            yield f"data: {json.dumps({'type': 'done'})}\n\n"
+            yield SSE_DONE
             
         except Exception as e:
             # Send error event
-            error_data = json.dumps({
+            yield SSE_PREFIX + orjson.dumps({
                 "type": "error",
                 "error": str(e)
-            })
-            yield f"data: {error_data}\n\n"
+            }) + SSE_SEP
     
     return StreamingResponse(
         event_generator(),
-        media_type="text/event-stream",
+        media_type="text/event-stream; charset=utf-8",
         headers={
             "Cache-Control": "no-cache",
+            "Content-Encoding": "identity",  # No intermediate gzip buffering
             "Connection": "keep-alive",
             "X-Accel-Buffering": "no",  # Disable Nginx buffering
         }
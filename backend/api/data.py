@@ -2,9 +2,11 @@
 from typing import List, Optional
 import pandas as pd
 import numpy as np
-from fastapi import APIRouter, HTTPException, Query
+import orjson
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 from datetime import datetime
 
+from src.analytics import category_correlation
 from backend.models.schemas import (
     SystemStats, 
     LifelogEntry, 
@@ -16,6 +18,161 @@ from backend.models.schemas import (
 router = APIRouter()
 
 
+def load_lifelog_df(csv_path: str) -> pd.DataFrame:
+    """Load the lifelog CSV once with dates parsed and category as categorical.
+    
+    Args:
+        csv_path: Path to the lifelog CSV file
+        
+    Returns:
+        Parsed lifelog DataFrame
+    """
+    return pd.read_csv(csv_path, parse_dates=['date'], dtype={'category': 'category'})
+
+
+def compute_data_insights(df: pd.DataFrame) -> DataInsights:
+    """Compute aggregated insights for the lifelog data.
+    
+    Args:
+        df: Parsed lifelog DataFrame
+        
+    Returns:
+        DataInsights with per-category summaries
+    """
+    # Calculate category summaries in a single grouped pass (first-appearance order)
+    stats = df.groupby('category', observed=True, sort=False)['mood_score'].agg(
+        avg='mean', cnt='count', mn='min', mx='max'
+    ).reset_index()
+    category_summaries = [
+        CategorySummary(
+            category=str(r.category),
+            average_score=float(r.avg),
+            entry_count=int(r.cnt),
+            min_score=int(r.mn),
+            max_score=int(r.mx)
+        )
+        for r in stats.itertuples(index=False)
+    ]
+    
+    # Calculate overall statistics
+    return DataInsights(
+        total_entries=len(df),
+        date_range={
+            "start": df['date'].min().isoformat(),
+            "end": df['date'].max().isoformat()
+        },
+        overall_average_score=float(df['mood_score'].mean()),
+        category_summaries=category_summaries
+    )
+
+
+def compute_correlation_data(df: pd.DataFrame) -> CorrelationData:
+    """Compute the correlation matrix between categories.
+    
+    Args:
+        df: Parsed lifelog DataFrame
+        
+    Returns:
+        CorrelationData with NaN values replaced by None
+    """
+    # Dense (dates x categories) matrix of daily mean scores, NaN where a day has no entry
+    wide_df = df.groupby(['date', 'category'], observed=True)['mood_score'].mean().unstack('category')
+    wide = wide_df.to_numpy(dtype=float)
+    categories = [str(c) for c in wide_df.columns]
+    corr = category_correlation(wide)
+    
+    # Round and replace NaN with None for JSON serialization (in NumPy, not per cell)
+    rounded = np.round(corr, 3)
+    matrix = rounded.astype(object)
+    matrix[np.isnan(rounded)] = None
+    matrix = matrix.tolist()
+    
+    return CorrelationData(
+        categories=categories,
+        correlation_matrix=matrix
+    )
+
+
+def refresh_data_caches(app, csv_path: str) -> int:
+    """(Re)load the lifelog CSV into app.state and rebuild the static response caches.
+    
+    On a reload (once the vector store exists) the Chroma collection is re-ingested
+    as well, and only then is the workflow's semantic response cache cleared.
+    
+    Args:
+        app: FastAPI application whose state holds the caches
+        csv_path: Path to the lifelog CSV file
+        
+    Returns:
+        Number of rows loaded
+    """
+    df = load_lifelog_df(csv_path)
+    insights = compute_data_insights(df)
+    correlations = compute_correlation_data(df)
+    
+    app.state.lifelog_df = df
+    # Date-sorted frame and per-category slices so filtered pages are index lookups
+    app.state.df_sorted = df.sort_values('date', kind='stable')
+    app.state.by_category = {
+        str(category): group
+        for category, group in app.state.df_sorted.groupby('category', observed=True, sort=False)
+    }
+    # JSON-ready rows, newest first, so /entries pages are plain list slices
+    app.state.entry_records = {None: entry_records(app.state.df_sorted.iloc[::-1])}
+    app.state.entry_records.update({
+        category: entry_records(group.iloc[::-1])
+        for category, group in app.state.by_category.items()
+    })
+    app.state.insights_cache = insights
+    app.state.corr_cache = correlations
+    # Pre-encoded bodies so the hot GETs don't re-serialize identical data
+    app.state.insights_bytes = orjson.dumps(insights.model_dump(mode='json'))
+    app.state.corr_bytes = orjson.dumps(correlations.model_dump(mode='json'))
+    
+    # Absent during startup, where the lifespan ingests the CSV itself
+    data_store = getattr(app.state, 'data_store', None)
+    if data_store is not None:
+        # Rebuilds the collection only if the CSV's data_version changed
+        data_store.load_and_store_csv(csv_path, df=df)
+        app.state.stats = data_store.get_stats()
+    # Answers cached against the previous data are stale
+    workflow = getattr(app.state, 'workflow', None)
+    if workflow is not None:
+        workflow.response_cache.clear()
+    return len(df)
+
+
+def entries_by_date(app, category: Optional[str] = None) -> pd.DataFrame:
+    """Get the date-sorted (ascending) entries, optionally for a single category.
+    
+    Args:
+        app: FastAPI application holding the cached frames
+        category: Category to filter by, or None for all entries
+        
+    Returns:
+        Date-sorted DataFrame (empty for an unknown category)
+    """
+    df_sorted = app.state.df_sorted
+    if not category:
+        return df_sorted
+    return app.state.by_category.get(category, df_sorted.iloc[0:0])
+
+
+def entry_records(df: pd.DataFrame) -> List[dict]:
+    """Convert lifelog rows to JSON-ready dicts in LifelogEntry field order.
+    
+    Args:
+        df: Slice of the parsed lifelog DataFrame
+        
+    Returns:
+        List of dicts with ISO-formatted dates
+    """
+    return df[['date', 'category', 'entry', 'mood_score']].assign(
+        date=df['date'].dt.strftime('%Y-%m-%dT%H:%M:%S'),
+        category=df['category'].astype(str)
+    ).to_dict(orient='records')
+
+
 @router.get("/stats", response_model=SystemStats)
 async def get_system_stats():
     """Get system statistics."""
@@ -34,142 +191,49 @@ async def get_system_stats():
 
 @router.get("/entries", response_model=List[LifelogEntry])
 async def get_lifelog_entries(
+    request: Request,
     limit: Optional[int] = Query(default=50, description="Number of entries to return"),
     offset: Optional[int] = Query(default=0, description="Number of entries to skip"),
     category: Optional[str] = Query(default=None, description="Filter by category")
 ):
     """Get lifelog entries with pagination."""
     try:
-        # Load the CSV data
-        df = pd.read_csv("data/sample_lifelog.csv")
-        df['date'] = pd.to_datetime(df['date'])
-        
-        # Apply category filter if provided
-        if category:
-            df = df[df['category'] == category]
-        
-        # Sort by date descending
-        df = df.sort_values('date', ascending=False)
+        # Rows were materialized newest-first at startup (empty for an unknown category)
+        records = request.app.state.entry_records.get(category or None, [])
         
-        # Apply pagination
-        df_page = df.iloc[offset:offset + limit]
-        
-        # Convert to response model
-        entries = []
-        for _, row in df_page.iterrows():
-            entries.append(LifelogEntry(
-                date=row['date'],
-                category=row['category'],
-                entry=row['entry'],
-                mood_score=row['mood_score']
-            ))
-        
-        return entries
+        # Apply pagination and encode the page in one pass (same JSON as List[LifelogEntry])
+        return Response(content=orjson.dumps(records[offset:offset + limit]), media_type="application/json")
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/insights", response_model=DataInsights)
-async def get_data_insights():
+async def get_data_insights(request: Request):
     """Get aggregated data insights."""
-    try:
-        # Load the CSV data
-        df = pd.read_csv("data/sample_lifelog.csv")
-        df['date'] = pd.to_datetime(df['date'])
-        
-        # Calculate category summaries
-        category_summaries = []
-        for category in df['category'].unique():
-            cat_df = df[df['category'] == category]
-            category_summaries.append(CategorySummary(
-                category=category,
-                average_score=float(cat_df['mood_score'].mean()),
-                entry_count=len(cat_df),
-                min_score=int(cat_df['mood_score'].min()),
-                max_score=int(cat_df['mood_score'].max())
-            ))
-        
-        # Calculate overall statistics
-        insights = DataInsights(
-            total_entries=len(df),
-            date_range={
-                "start": df['date'].min().isoformat(),
-                "end": df['date'].max().isoformat()
-            },
-            overall_average_score=float(df['mood_score'].mean()),
-            category_summaries=category_summaries
-        )
-        
-        return insights
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    # Computed and encoded once at startup (see refresh_data_caches)
+    return Response(content=request.app.state.insights_bytes, media_type="application/json")
 
 
 @router.get("/correlations", response_model=CorrelationData)
-async def get_correlation_data():
+async def get_correlation_data(request: Request):
     """Get correlation matrix between categories."""
-    try:
-        # Load the CSV data
-        df = pd.read_csv("data/sample_lifelog.csv")
-        df['date'] = pd.to_datetime(df['date'])
-        
-        # Pivot to get categories as columns
-        pivot_df = df.pivot_table(
-            index='date', 
-            columns='category', 
-            values='mood_score',
-            aggfunc='mean'  # Handle multiple entries per date
-        )
-        
-        # Calculate correlation matrix
-        corr_matrix = pivot_df.corr()
-        
-        # Convert to response format
-        categories = corr_matrix.columns.tolist()
-        matrix = corr_matrix.values.tolist()
-        
-        # Replace NaN with None for JSON serialization
-        matrix = [[None if np.isnan(x) else round(x, 3) for x in row] for row in matrix]
-        
-        return CorrelationData(
-            categories=categories,
-            correlation_matrix=matrix
-        )
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    # Computed and encoded once at startup (see refresh_data_caches)
+    return Response(content=request.app.state.corr_bytes, media_type="application/json")
 
 
 @router.get("/timeline")
 async def get_timeline_data(
+    request: Request,
     category: Optional[str] = Query(default=None, description="Filter by category")
 ):
     """Get timeline data for charts."""
     try:
-        # Load the CSV data
-        df = pd.read_csv("data/sample_lifelog.csv")
-        df['date'] = pd.to_datetime(df['date'])
-        
-        # Apply category filter if provided
-        if category:
-            df = df[df['category'] == category]
-        
-        # Sort by date
-        df = df.sort_values('date')
-        
-        # Group by date and category for timeline
-        timeline_data = []
-        for _, row in df.iterrows():
-            timeline_data.append({
-                "date": row['date'].isoformat(),
-                "category": row['category'],
-                "mood_score": row['mood_score'],
-                "entry": row['entry']
-            })
+        # Pre-filtered and sorted by date at startup
+        df = entries_by_date(request.app, category)
         
-        return {"data": timeline_data}
+        # Encode the timeline in one pass
+        return Response(content=orjson.dumps({"data": entry_records(df)}), media_type="application/json")
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
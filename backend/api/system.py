@@ -1,15 +1,15 @@
 """System information API endpoints."""
 from typing import List, Dict
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, HTTPException, Response
 
 from backend.models.schemas import AgentInfo, SystemArchitecture
 
 router = APIRouter()
 
 
-@router.get("/agents", response_model=List[AgentInfo])
-async def get_active_agents():
-    """Get information about active agents."""
+def _active_agents() -> List[AgentInfo]:
+    """Build information about active agents."""
     agents = [
         AgentInfo(
             name="Reasoning Agent",
@@ -58,9 +58,8 @@ async def get_active_agents():
     return agents
 
 
-@router.get("/architecture", response_model=SystemArchitecture)
-async def get_system_architecture():
-    """Get system architecture information."""
+def _system_architecture() -> SystemArchitecture:
+    """Build system architecture information."""
     return SystemArchitecture(
         title="Multi-Agent Architecture",
         description="Sophisticated multi-agent architecture using NVIDIA Nemotron models, orchestrated by LangGraph",
@@ -118,9 +117,8 @@ async def get_system_architecture():
     )
 
 
-@router.get("/features")
-async def get_system_features():
-    """Get key features demonstrated by the system."""
+def _system_features() -> Dict:
+    """Build key features demonstrated by the system."""
     features = {
         "agentic_behavior": "Autonomous reasoning and decision-making",
         "react_pattern": "Reason → Act → Observe cycles for complex problem-solving",
@@ -137,9 +135,8 @@ async def get_system_features():
     return {"features": features}
 
 
-@router.get("/demo-questions")
-async def get_demo_questions():
-    """Get demo questions for quick testing."""
+def _demo_questions() -> Dict:
+    """Build demo questions for quick testing."""
     questions = [
         "What patterns do you see in my sleep quality?",
         "How does exercise impact my mood and energy levels?",
@@ -150,3 +147,34 @@ async def get_demo_questions():
     ]
     
     return {"questions": questions}
+
+
+# The system info is static: validate and encode it once at import time
+_AGENTS_JSON = orjson.dumps([agent.model_dump() for agent in _active_agents()])
+_ARCHITECTURE_JSON = orjson.dumps(_system_architecture().model_dump())
+_FEATURES_JSON = orjson.dumps(_system_features())
+_QUESTIONS_JSON = orjson.dumps(_demo_questions())
+
+
+@router.get("/agents", response_model=List[AgentInfo])
+async def get_active_agents():
+    """Get information about active agents."""
+    return Response(content=_AGENTS_JSON, media_type="application/json")
+
+
+@router.get("/architecture", response_model=SystemArchitecture)
+async def get_system_architecture():
+    """Get system architecture information."""
+    return Response(content=_ARCHITECTURE_JSON, media_type="application/json")
+
+
+@router.get("/features")
+async def get_system_features():
+    """Get key features demonstrated by the system."""
+    return Response(content=_FEATURES_JSON, media_type="application/json")
+
+
+@router.get("/demo-questions")
+async def get_demo_questions():
+    """Get demo questions for quick testing."""
+    return Response(content=_QUESTIONS_JSON, media_type="application/json")
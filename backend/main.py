@@ -5,7 +5,7 @@ from pathlib import Path
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 import uvicorn
 from dotenv import load_dotenv
 
@@ -14,22 +14,32 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from src.data_store import LifelogDataStore
 from src.agentic_workflow import LifelogAgentWorkflow
+from src.agents import close_shared_client
+from backend.services.workflow import WorkflowService
 
 # Load environment variables
 load_dotenv()
 
+LIFELOG_CSV = "data/sample_lifelog.csv"
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifecycle - initialize resources on startup."""
+    from backend.api.data import refresh_data_caches
+    
     # Initialize data store
     try:
+        # Parse the CSV once and share it with the data endpoints
+        refresh_data_caches(app, LIFELOG_CSV)
+        
         app.state.data_store = LifelogDataStore()
-        count = app.state.data_store.load_and_store_csv("data/sample_lifelog.csv")
+        count = app.state.data_store.load_and_store_csv(LIFELOG_CSV, df=app.state.lifelog_df)
         print(f"✅ Loaded {count} entries into vector database")
         
         # Initialize workflow
         app.state.workflow = LifelogAgentWorkflow(app.state.data_store)
+        app.state.workflow_service = WorkflowService(app.state.workflow)
         print("✅ Initialized agentic workflow")
         
         # Get stats
@@ -42,7 +52,9 @@ async def lifespan(app: FastAPI):
     
     yield
     
-    # Cleanup (if needed)
+    # Cleanup
+    app.state.workflow.close()
+    close_shared_client()
     print("👋 Shutting down application")
 
 
@@ -51,7 +63,9 @@ app = FastAPI(
     title="Agentic Lifelog API",
     description="Backend API for NVIDIA GTC Hackathon 2025 - Nemotron Prize Track",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # Render response models with orjson instead of stdlib json.dumps
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -92,12 +106,28 @@ async def health_check():
             "workflow": "ready"
         }
     except:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=503,
             content={"status": "unhealthy", "error": "Services not initialized"}
         )
 
 
+@app.post("/admin/reload")
+def reload_data():
+    """Reload the lifelog CSV, re-ingest the vector store and rebuild the cached insights/correlations."""
+    from backend.api.data import refresh_data_caches
+    
+    try:
+        count = refresh_data_caches(app, LIFELOG_CSV)
+        print(f"🔄 Reloaded {count} entries from {LIFELOG_CSV}")
+        return {"status": "reloaded", "total_entries": count}
+    except Exception as e:
+        return ORJSONResponse(
+            status_code=500,
+            content={"status": "error", "error": str(e)}
+        )
+
+
 # Import and include routers
 from backend.api import chat, data, system
 
@@ -107,11 +137,13 @@ app.include_router(system.router, prefix="/api/system", tags=["system"])
 
 
 if __name__ == "__main__":
-    # Run with uvicorn when executed directly
+    # Run with uvicorn when executed directly. uvicorn[standard] ships uvloop and
+    # httptools, which the default loop/http="auto" pick up; reload is dev-only.
     uvicorn.run(
         "backend.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        workers=int(os.getenv("WORKERS", "1")),
+        reload=os.getenv("DEV") == "1",
         log_level="info"
     )
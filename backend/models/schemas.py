@@ -1,7 +1,12 @@
 """Pydantic models for API requests and responses."""
 from typing import List, Optional, Dict, Any, Union
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class ResponseModel(BaseModel):
+    """Base for response-only models: immutable, and unknown fields are rejected."""
+    model_config = ConfigDict(extra='forbid', frozen=True)
 
 
 # Chat related models
@@ -26,7 +31,7 @@ class SafetyCheck(BaseModel):
     needs_modification: Optional[bool] = Field(None, description="Whether output needs modification")
 
 
-class ChatResponse(BaseModel):
+class ChatResponse(ResponseModel):
     """Response model for chat messages."""
     success: bool
     response: str
@@ -38,10 +43,10 @@ class ChatResponse(BaseModel):
     error: Optional[str] = None
 
 
-class ChatMessage(BaseModel):
+class ChatMessage(ResponseModel):
     """Model for a chat message in history."""
-    role: str = Field(..., description="Message role (user/assistant)")
-    content: str = Field(..., description="Message content")
+    role: str
+    content: str
     timestamp: datetime
     reasoning_steps: Optional[List[ReasoningStep]] = None
     safety_checks: Optional[List[SafetyCheck]] = None
@@ -49,31 +54,31 @@ class ChatMessage(BaseModel):
 
 
 # WebSocket models
-class WSMessage(BaseModel):
+class WSMessage(ResponseModel):
     """WebSocket message format."""
-    type: str = Field(..., description="Message type (intermediate/final/error)")
+    type: str
     content: Optional[str] = None
     reasoning_step: Optional[ReasoningStep] = None
     metrics: Optional[Dict[str, Any]] = None
 
 
 # Data related models
-class SystemStats(BaseModel):
+class SystemStats(ResponseModel):
     """System statistics model."""
     total_entries: int
     collection_name: str
     status: str
 
 
-class LifelogEntry(BaseModel):
+class LifelogEntry(ResponseModel):
     """Model for a lifelog entry."""
     date: datetime
     category: str
     entry: str
-    mood_score: int = Field(..., ge=1, le=5, description="Mood score from 1 to 5")
+    mood_score: int = Field(..., ge=1, le=5)
 
 
-class CategorySummary(BaseModel):
+class CategorySummary(ResponseModel):
     """Summary statistics for a category."""
     category: str
     average_score: float
@@ -82,7 +87,7 @@ class CategorySummary(BaseModel):
     max_score: int
 
 
-class DataInsights(BaseModel):
+class DataInsights(ResponseModel):
     """Aggregated data insights."""
     total_entries: int
     date_range: Dict[str, str]
@@ -90,23 +95,23 @@ class DataInsights(BaseModel):
     category_summaries: List[CategorySummary]
 
 
-class CorrelationData(BaseModel):
+class CorrelationData(ResponseModel):
     """Correlation matrix data."""
     categories: List[str]
     correlation_matrix: List[List[Optional[float]]]
 
 
 # System related models
-class AgentInfo(BaseModel):
+class AgentInfo(ResponseModel):
     """Information about an agent in the system."""
     name: str
     model: str
     description: str
     icon: str
-    status: str = Field(..., description="active/inactive")
+    status: str
 
 
-class SystemArchitecture(BaseModel):
+class SystemArchitecture(ResponseModel):
     """System architecture information."""
     title: str
     description: str
@@ -123,7 +128,7 @@ class TimelineRequest(BaseModel):
     end_date: Optional[datetime] = None
 
 
-class TimelineDataPoint(BaseModel):
+class TimelineDataPoint(ResponseModel):
     """A single data point in the timeline."""
     date: str
     category: str
@@ -131,6 +136,6 @@ class TimelineDataPoint(BaseModel):
     entry: str
 
 
-class TimelineResponse(BaseModel):
+class TimelineResponse(ResponseModel):
     """Response containing timeline data."""
     data: List[TimelineDataPoint]
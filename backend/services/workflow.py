@@ -1,7 +1,8 @@
 """Workflow service wrapper for async operations."""
 import asyncio
+import hashlib
+import time
 from typing import Dict, AsyncGenerator, Any
-from datetime import datetime
 
 from src.agentic_workflow import LifelogAgentWorkflow
 
@@ -12,20 +13,30 @@ class WorkflowService:
     def __init__(self, workflow: LifelogAgentWorkflow):
         """Initialize with an existing workflow instance."""
         self.workflow = workflow
+        # Runs in progress keyed by message hash, so duplicate requests share one run
+        self._inflight: Dict[str, asyncio.Task] = {}
     
     async def process_message(self, message: str) -> Dict[str, Any]:
         """Process a message asynchronously.
         
+        Concurrent calls with the same message await a single workflow run.
+        
         Args:
             message: User's message to process
             
         Returns:
             Dictionary with response and metadata
         """
-        # Run the synchronous workflow in an executor
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(None, self.workflow.run, message)
-        return result
+        key = hashlib.blake2b(message.encode(), digest_size=16).hexdigest()
+        task = self._inflight.get(key)
+        if task is None:
+            # Native async graph execution; LangGraph keeps the blocking node bodies off the loop
+            task = asyncio.create_task(self.workflow.arun(message))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        
+        # Shielded so one caller disconnecting doesn't cancel the run for the others
+        return await asyncio.shield(task)
     
     async def stream_message(self, message: str) -> AsyncGenerator[Dict[str, Any], None]:
         """Stream the message processing for WebSocket updates.
@@ -36,48 +47,14 @@ class WorkflowService:
         Yields:
             Dictionary events with intermediate and final results
         """
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         try:
-            # Since the original workflow has a stream method, we'll use it
-            # but wrap it for async operation
-            loop = asyncio.get_event_loop()
-            
-            # Create a queue to handle the streaming
-            queue = asyncio.Queue()
-            
-            def stream_handler():
-                """Run the stream in a thread and put results in queue."""
-                try:
-                    for event in self.workflow.stream(message):
-                        # Put event in queue
-                        asyncio.run_coroutine_threadsafe(
-                            queue.put(event), loop
-                        )
-                    # Signal completion
-                    asyncio.run_coroutine_threadsafe(
-                        queue.put(None), loop
-                    )
-                except Exception as e:
-                    # Put error in queue
-                    asyncio.run_coroutine_threadsafe(
-                        queue.put({"type": "error", "error": str(e)}), loop
-                    )
-            
-            # Run stream handler in executor
-            loop.run_in_executor(None, stream_handler)
-            
-            # Yield events from queue
-            while True:
-                event = await queue.get()
-                
-                if event is None:
-                    # Stream completed
-                    break
-                
+            # Iterate the graph's native async stream: no worker thread or cross-thread queue
+            async for event in self.workflow.astream(message):
                 # Add elapsed time to events
                 if event.get("type") in ["intermediate", "final"]:
-                    event["elapsed_time"] = (datetime.now() - start_time).total_seconds()
+                    event["elapsed_time"] = time.perf_counter() - start_time
                 
                 yield event
                 
@@ -85,7 +62,7 @@ class WorkflowService:
             yield {
                 "type": "error",
                 "error": str(e),
-                "elapsed_time": (datetime.now() - start_time).total_seconds()
+                "elapsed_time": time.perf_counter() - start_time
             }
     
     async def get_workflow_stats(self) -> Dict[str, Any]:
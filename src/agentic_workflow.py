@@ -1,10 +1,13 @@
 """LangGraph agentic workflow for personal lifelog analysis with ReAct pattern."""
 from typing import TypedDict, Annotated, Sequence
 import operator
-from langgraph.graph import StateGraph, END
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from langgraph.graph import StateGraph, START, END
 from src.agents import QueryAnalyzer, ReasoningAgent, SafetyGuardAgent, ReActAgent
 from src.data_store import LifelogDataStore
 from src.insights_cache import InsightsCache
+from src.semantic_cache import SemanticCache
 
 
 class AgentState(TypedDict):
@@ -13,13 +16,19 @@ class AgentState(TypedDict):
     query_analysis: dict
     retrieved_data: list
     response: str
-    reasoning_steps: list
-    safety_checks: list
+    # Nodes return only new items for these lists; LangGraph concatenates them
+    reasoning_steps: Annotated[list, operator.add]
+    safety_checks: Annotated[list, operator.add]
     react_context: dict
-    observations: list
+    observations: Annotated[list, operator.add]
     iteration_count: int
     should_continue: bool
     cached_insights: dict  # NEW: Pre-computed insights from background agents
+    query_embedding: list  # Query vector shared by the response cache and retrieval
+
+
+# AgentState fields whose node updates are appended rather than replaced
+APPEND_KEYS = frozenset({"reasoning_steps", "safety_checks", "observations"})
 
 
 class LifelogAgentWorkflow:
@@ -39,13 +48,64 @@ class LifelogAgentWorkflow:
         self.react_agent = ReActAgent()
         self.max_iterations = max_iterations
         self.insights_cache = InsightsCache()  # NEW: Cache for pre-computed insights
+        self.response_cache = SemanticCache(max_entries=1024, threshold=0.95)  # Paraphrase-tolerant result cache
+        self.pending_insights = None  # Future for a background analysis still in flight
+        # Runs speculative OBSERVE calls alongside REASON (see react_reason_node)
+        self.speculation_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="react-speculate")
         self.graph = self._build_graph()
     
+    def warmup(self):
+        """Open the pooled NVIDIA API connection before the first user query.
+        
+        Failures are logged and ignored; the first real call will simply pay the setup cost.
+        """
+        try:
+            self.reasoning_agent.client.models.list()
+        except Exception as e:
+            print(f"⚠️ NVIDIA API warmup failed: {e}")
+    
+    def close(self):
+        """Release the speculation threads (the shared API client is closed by its owner)."""
+        self.speculation_pool.shutdown(wait=False, cancel_futures=True)
+    
+    def attach_background_analysis(self, future):
+        """Register an in-flight background analysis whose result should feed the insights cache.
+        
+        Args:
+            future: concurrent.futures.Future resolving to the insights dict from
+                BackgroundAnalyzer.run_analysis
+        """
+        self.pending_insights = future
+    
+    def _get_cached_insights(self, query: str) -> dict:
+        """Insights tool: look up relevant insights, never waiting on the background analysis.
+        
+        Args:
+            query: User's natural language question
+            
+        Returns:
+            Dictionary of pre-computed insights relevant to the query (empty while the
+            first background analysis is still running and no cache exists yet)
+        """
+        future = self.pending_insights
+        if future is not None:
+            if not future.done():
+                # Still computing: answer from whatever the cache already holds
+                return self.insights_cache.get_relevant_insights(query)
+            try:
+                self.insights_cache.insights = future.result()
+            except Exception as e:
+                print(f"⚠️ Background analysis failed, using existing insights cache: {e}")
+            self.pending_insights = None
+        
+        return self.insights_cache.get_relevant_insights(query)
+    
     def _build_graph(self) -> StateGraph:
         """Build the LangGraph workflow with ReAct pattern and safety guardrails.
         
         The workflow follows this pattern:
-        1. Safety Check (Input) - Validate user input
+        1. Safety Check (Input) - Validate user input, in parallel with the
+           initial data retrieval (prefetch)
         2. ReAct Loop:
            - Reason: Analyze query and plan actions
            - Act: Retrieve data or perform actions
@@ -60,6 +120,7 @@ class LifelogAgentWorkflow:
         
         # Add nodes for safety guardrails
         workflow.add_node("safety_check_input", self.safety_check_input_node)
+        workflow.add_node("prefetch_data", self.prefetch_data_node)
         workflow.add_node("safety_check_output", self.safety_check_output_node)
         
         # Add nodes for ReAct pattern
@@ -70,11 +131,13 @@ class LifelogAgentWorkflow:
         # Add node for final synthesis
         workflow.add_node("synthesize_response", self.synthesize_response_node)
         
-        # Define workflow flow
-        workflow.set_entry_point("safety_check_input")
+        # Define workflow flow: input safety check and data prefetch are independent,
+        # so both start the graph and run in the same (parallel) step
+        workflow.add_edge(START, "safety_check_input")
+        workflow.add_edge(START, "prefetch_data")
         
-        # After input safety check, start ReAct reasoning
-        workflow.add_edge("safety_check_input", "react_reason")
+        # Start ReAct reasoning once both branches have finished
+        workflow.add_edge(["safety_check_input", "prefetch_data"], "react_reason")
         
         # After reasoning, perform action
         workflow.add_edge("react_reason", "react_act")
@@ -103,26 +166,23 @@ class LifelogAgentWorkflow:
     def _should_continue_react(self, state: AgentState) -> str:
         """Determine if ReAct loop should continue or move to synthesis.
         
+        Synthesize once max iterations are reached, the agent decided it has
+        sufficient information, or enough data has been gathered. Every AgentState
+        key is set by initial_state(), so the fields are read directly.
+        
         Args:
             state: Current agent state
             
         Returns:
             "continue" to keep looping, "synthesize" to generate final answer
         """
-        # Check if we've hit max iterations
-        if state.get("iteration_count", 0) >= self.max_iterations:
-            return "synthesize"
-        
-        # Check if agent decided it has sufficient information
-        if state.get("should_continue", False) is False:
-            return "synthesize"
-        
-        # Check if we have enough data
-        if len(state.get("observations", [])) >= 2 and state.get("retrieved_data"):
-            return "synthesize"
-        
-        # Continue by default
-        return "continue"
+        max_iterations = self.max_iterations
+        done = (
+            state["iteration_count"] >= max_iterations
+            or not state["should_continue"]
+            or (len(state["observations"]) >= 2 and bool(state["retrieved_data"]))
+        )
+        return "synthesize" if done else "continue"
     
     def safety_check_input_node(self, state: AgentState) -> AgentState:
         """Node: Safety check for user input using Nemotron Safety Guard.
@@ -134,8 +194,8 @@ class LifelogAgentWorkflow:
             Updated state with safety check results
         """
         query = state["query"]
-        reasoning_steps = state.get("reasoning_steps", [])
-        safety_checks = state.get("safety_checks", [])
+        reasoning_steps = []  # New steps only; the reducer appends them to the state
+        safety_checks = []
         
         reasoning_steps.append({
             "step": "🛡️ Input Safety Check",
@@ -161,7 +221,6 @@ class LifelogAgentWorkflow:
             })
             
             return {
-                **state,
                 "safety_checks": safety_checks,
                 "reasoning_steps": reasoning_steps,
                 "response": f"I'm sorry, but I can't process this request. It was flagged for: {safety_result['category']}. Please rephrase your question.",
@@ -174,12 +233,49 @@ class LifelogAgentWorkflow:
         })
         
         return {
-            **state,
             "safety_checks": safety_checks,
             "reasoning_steps": reasoning_steps,
             "should_continue": True
         }
     
+    def prefetch_data_node(self, state: AgentState) -> dict:
+        """Node: Retrieve lifelog entries and cached insights while the input safety check runs.
+        
+        Args:
+            state: Current agent state
+            
+        Returns:
+            Partial state update with retrieved data and cached insights
+        """
+        query = state["query"]
+        return {
+            "retrieved_data": self.data_store.query(
+                query, n_results=5, query_embedding=state.get("query_embedding")
+            ),
+            "cached_insights": self._get_cached_insights(query)
+        }
+    
+    def _retrieve(self, state: AgentState):
+        """Return (results, cached_insights) for the query, reusing the prefetched data if present.
+        
+        Every ReAct ACT retrieves for the same query, so the prefetch result stays valid.
+        """
+        if state.get("retrieved_data"):
+            return state["retrieved_data"], state.get("cached_insights", {})
+        query = state["query"]
+        results = self.data_store.query(
+            query, n_results=5, query_embedding=state.get("query_embedding")
+        )
+        return results, self._get_cached_insights(query)
+    
+    @staticmethod
+    def _describe_retrieval(results: list, cached_insights: dict) -> str:
+        """Action result text reported by a data-retrieval ACT."""
+        action_result = f"Retrieved {len(results)} entries"
+        if cached_insights:
+            action_result += f" and {len(cached_insights)} pre-computed insights"
+        return action_result
+    
     def react_reason_node(self, state: AgentState) -> AgentState:
         """Node: ReAct REASON - Analyze query and plan next action.
         
@@ -190,8 +286,8 @@ class LifelogAgentWorkflow:
             Updated state with reasoning and action plan
         """
         query = state["query"]
-        reasoning_steps = state.get("reasoning_steps", [])
-        react_context = state.get("react_context", {})
+        reasoning_steps = []  # New steps only; the reducer appends them to the state
+        react_context = dict(state.get("react_context", {}))
         observations = state.get("observations", [])
         iteration = state.get("iteration_count", 0)
         
@@ -200,6 +296,19 @@ class LifelogAgentWorkflow:
             "description": "Analyzing problem and planning next action"
         })
         
+        # ACT reuses the prefetched data, so its result is known before REASON finishes:
+        # speculatively start OBSERVE on it now and let react_observe_node pick it up
+        if state.get("retrieved_data"):
+            expected_result = self._describe_retrieval(
+                state["retrieved_data"], state.get("cached_insights", {})
+            )
+            react_context["speculative_observation"] = (
+                expected_result,
+                self.speculation_pool.submit(
+                    self.react_agent.observe_and_reflect, expected_result, query
+                )
+            )
+        
         # Use ReAct agent to reason about the query
         reasoning_result = self.react_agent.reason_and_plan(
             query,
@@ -216,7 +325,6 @@ class LifelogAgentWorkflow:
         })
         
         return {
-            **state,
             "react_context": react_context,
             "reasoning_steps": reasoning_steps
         }
@@ -230,8 +338,7 @@ class LifelogAgentWorkflow:
         Returns:
             Updated state with action results
         """
-        query = state["query"]
-        reasoning_steps = state.get("reasoning_steps", [])
+        reasoning_steps = []  # New steps only; the reducer appends them to the state
         react_context = state.get("react_context", {})
         next_action = react_context.get("next_action", "data_retrieval")
         
@@ -243,16 +350,11 @@ class LifelogAgentWorkflow:
         # Execute the action (for now, always retrieve data)
         # In future iterations, this could call different tools
         if "data" in next_action or "retrieval" in next_action or "analysis" in next_action:
-            # Existing data retrieval
-            results = self.data_store.query(query, n_results=5)
-            
-            # NEW: Get cached insights (simple)
-            cached_insights = self.insights_cache.get_relevant_insights(query)
+            # Data retrieval plus cached insights (prefetched in parallel with the input check)
+            results, cached_insights = self._retrieve(state)
             
             # Add to context
-            action_result = f"Retrieved {len(results)} entries"
-            if cached_insights:
-                action_result += f" and {len(cached_insights)} pre-computed insights"
+            action_result = self._describe_retrieval(results, cached_insights)
             
             reasoning_steps.append({
                 "step": "📊 Data Retrieved",
@@ -267,7 +369,6 @@ class LifelogAgentWorkflow:
             
             # Store both in state
             return {
-                **state,
                 "retrieved_data": results,
                 "cached_insights": cached_insights,  # NEW field
                 "react_context": {
@@ -278,18 +379,12 @@ class LifelogAgentWorkflow:
                 "reasoning_steps": reasoning_steps
             }
         else:
-            # Default action
-            results = self.data_store.query(query, n_results=5)
+            # Default action (also gets insights)
+            results, cached_insights = self._retrieve(state)
             
-            # NEW: Also get insights for default action
-            cached_insights = self.insights_cache.get_relevant_insights(query)
-            
-            action_result = f"Retrieved {len(results)} entries"
-            if cached_insights:
-                action_result += f" and {len(cached_insights)} insights"
+            action_result = self._describe_retrieval(results, cached_insights)
             
             return {
-                **state,
                 "retrieved_data": results,
                 "cached_insights": cached_insights,  # NEW
                 "react_context": {**react_context, "last_action_result": action_result},
@@ -306,9 +401,9 @@ class LifelogAgentWorkflow:
             Updated state with observations and continuation decision
         """
         query = state["query"]
-        reasoning_steps = state.get("reasoning_steps", [])
-        react_context = state.get("react_context", {})
-        observations = state.get("observations", [])
+        reasoning_steps = []  # New steps only; the reducer appends them to the state
+        react_context = dict(state.get("react_context", {}))
+        observations = []
         iteration_count = state.get("iteration_count", 0)
         
         reasoning_steps.append({
@@ -319,8 +414,15 @@ class LifelogAgentWorkflow:
         # Get last action result
         action_result = react_context.get("last_action_result", "No action result")
         
-        # Use ReAct agent to observe and reflect
-        observation_result = self.react_agent.observe_and_reflect(action_result, query)
+        # Use ReAct agent to observe and reflect (reusing the speculative call
+        # started during REASON when it was made for this same action result)
+        speculative = react_context.pop("speculative_observation", None)
+        if speculative is not None and speculative[0] == action_result:
+            observation_result = speculative[1].result()
+        else:
+            if speculative is not None:
+                speculative[1].cancel()  # Made for a different result; stop it if not yet running
+            observation_result = self.react_agent.observe_and_reflect(action_result, query)
         
         # Add observation to history
         observations.append(observation_result["observation"])
@@ -350,8 +452,8 @@ class LifelogAgentWorkflow:
             })
         
         return {
-            **state,
             "observations": observations,
+            "react_context": react_context,
             "iteration_count": iteration_count,
             "should_continue": should_continue,
             "reasoning_steps": reasoning_steps
@@ -369,7 +471,7 @@ class LifelogAgentWorkflow:
         query = state["query"]
         retrieved_data = state.get("retrieved_data", [])
         cached_insights = state.get("cached_insights", {})  # NEW
-        reasoning_steps = state.get("reasoning_steps", [])
+        reasoning_steps = []  # New steps only; the reducer appends them to the state
         observations = state.get("observations", [])
         
         reasoning_steps.append({
@@ -401,7 +503,6 @@ class LifelogAgentWorkflow:
             })
         
         return {
-            **state,
             "response": response,
             "reasoning_steps": reasoning_steps
         }
@@ -417,8 +518,8 @@ class LifelogAgentWorkflow:
         """
         query = state["query"]
         response = state.get("response", "")
-        reasoning_steps = state.get("reasoning_steps", [])
-        safety_checks = state.get("safety_checks", [])
+        reasoning_steps = []  # New steps only; the reducer appends them to the state
+        safety_checks = []
         
         reasoning_steps.append({
             "step": "🛡️ Output Safety Check",
@@ -444,7 +545,6 @@ class LifelogAgentWorkflow:
             })
             
             return {
-                **state,
                 "safety_checks": safety_checks,
                 "reasoning_steps": reasoning_steps,
                 "response": "I apologize, but I need to refine my response. Let me provide a safer answer based on your data."
@@ -463,21 +563,14 @@ class LifelogAgentWorkflow:
             })
         
         return {
-            **state,
             "safety_checks": safety_checks,
             "reasoning_steps": reasoning_steps
         }
     
-    def run(self, query: str) -> dict:
-        """Execute the workflow for a given query with ReAct pattern and safety checks.
-        
-        Args:
-            query: User's natural language question
-            
-        Returns:
-            Dictionary with response, reasoning steps, safety checks, and ReAct observations
-        """
-        initial_state = {
+    @staticmethod
+    def initial_state(query: str, query_embedding: list = None) -> dict:
+        """Fresh graph input state for a query (embedding reused for retrieval when given)."""
+        return {
             "query": query,
             "query_analysis": {},
             "retrieved_data": [],
@@ -488,32 +581,140 @@ class LifelogAgentWorkflow:
             "observations": [],
             "iteration_count": 0,
             "should_continue": True,
-            "cached_insights": {}  # NEW: Initialize cached insights
+            "cached_insights": {},  # NEW: Initialize cached insights
+            "query_embedding": query_embedding
+        }
+    
+    @staticmethod
+    def _final_result(query: str, final_state: dict) -> dict:
+        """Shape the final graph state into the run()/arun() result dictionary."""
+        return {
+            "success": True,
+            "query": query,
+            "response": final_state.get("response", ""),
+            "reasoning_steps": final_state.get("reasoning_steps", []),
+            "safety_checks": final_state.get("safety_checks", []),
+            "observations": final_state.get("observations", []),
+            "react_cycles": final_state.get("iteration_count", 0),
+            "retrieved_entries": len(final_state.get("retrieved_data", []))
+        }
+    
+    @staticmethod
+    def _error_result(query: str, error: Exception) -> dict:
+        """Result dictionary for a failed run."""
+        return {
+            "success": False,
+            "query": query,
+            "error": str(error),
+            "response": f"Sorry, I encountered an error: {str(error)}",
+            "reasoning_steps": []
         }
+    
+    @staticmethod
+    def merge_update(state: dict, update: dict) -> dict:
+        """Apply a node's update to a running copy of the state, honouring AgentState's reducers.
+        
+        Args:
+            state: Accumulated state (modified in place)
+            update: Partial state returned by a node, as emitted by graph.stream()
+            
+        Returns:
+            The updated state
+        """
+        for key, value in (update or {}).items():
+            if key in APPEND_KEYS:
+                state[key] = state.get(key, []) + value
+            else:
+                state[key] = value
+        return state
+    
+    @staticmethod
+    def _intermediate_event(node_name: str, current_state: dict) -> dict:
+        """Streamed update emitted after a node finishes."""
+        return {
+            "type": "intermediate",
+            "node": node_name,
+            "reasoning_steps": current_state.get("reasoning_steps", []),
+            "safety_checks": current_state.get("safety_checks", []),
+            "iteration_count": current_state.get("iteration_count", 0),
+            "should_continue": current_state.get("should_continue", True)
+        }
+    
+    def _cached_result(self, query: str):
+        """Look the query up in the semantic response cache.
+        
+        A hit is only served once the query itself passes the input safety check;
+        otherwise the caller falls through to the full graph, which blocks it.
+        
+        Args:
+            query: User's natural language question
+            
+        Returns:
+            Tuple of (query embedding or None if embedding failed, cached result or None)
+        """
+        try:
+            embedding = self.data_store.embedding_function.client.embed_query(query)
+        except Exception as e:
+            print(f"⚠️ Query embedding for the response cache failed: {e}")
+            return None, None
+        
+        cached = self.response_cache.lookup(embedding)
+        if cached is None:
+            return embedding, None
+        if self.safety_guard.check_input_safety(query).get("should_block", False):
+            return embedding, None
+        return embedding, {**cached, "query": query, "cache_hit": True}
+    
+    def _remember_result(self, embedding, result: dict):
+        """Store a successful result in the semantic response cache."""
+        if embedding is not None and result.get("success"):
+            self.response_cache.store(embedding, result)
+    
+    def run(self, query: str) -> dict:
+        """Execute the workflow for a given query with ReAct pattern and safety checks.
+        
+        Args:
+            query: User's natural language question
+            
+        Returns:
+            Dictionary with response, reasoning steps, safety checks, and ReAct observations
+        """
+        embedding, cached = self._cached_result(query)
+        if cached is not None:
+            return cached
         
         try:
             # Run the graph
-            final_state = self.graph.invoke(initial_state)
+            final_state = self.graph.invoke(self.initial_state(query, embedding))
+            result = self._final_result(query, final_state)
+            self._remember_result(embedding, result)
+            return result
+        
+        except Exception as e:
+            return self._error_result(query, e)
+    
+    async def arun(self, query: str) -> dict:
+        """Async variant of run() for event-loop callers such as the FastAPI backend.
+        
+        Args:
+            query: User's natural language question
             
-            return {
-                "success": True,
-                "query": query,
-                "response": final_state.get("response", ""),
-                "reasoning_steps": final_state.get("reasoning_steps", []),
-                "safety_checks": final_state.get("safety_checks", []),
-                "observations": final_state.get("observations", []),
-                "react_cycles": final_state.get("iteration_count", 0),
-                "retrieved_entries": len(final_state.get("retrieved_data", []))
-            }
+        Returns:
+            Same dictionary as run()
+        """
+        embedding, cached = await asyncio.to_thread(self._cached_result, query)
+        if cached is not None:
+            return cached
+        
+        try:
+            # LangGraph schedules the (blocking) node bodies on its own executor
+            final_state = await self.graph.ainvoke(self.initial_state(query, embedding))
+            result = self._final_result(query, final_state)
+            self._remember_result(embedding, result)
+            return result
         
         except Exception as e:
-            return {
-                "success": False,
-                "query": query,
-                "error": str(e),
-                "response": f"Sorry, I encountered an error: {str(e)}",
-                "reasoning_steps": []
-            }
+            return self._error_result(query, e)
     
     def stream(self, query: str):
         """Stream the workflow execution with intermediate steps for real-time UI updates.
@@ -524,62 +725,62 @@ class LifelogAgentWorkflow:
         Yields:
             Dictionaries with intermediate state updates for streaming to UI
         """
-        initial_state = {
-            "query": query,
-            "query_analysis": {},
-            "retrieved_data": [],
-            "response": "",
-            "reasoning_steps": [],
-            "safety_checks": [],
-            "react_context": {},
-            "observations": [],
-            "iteration_count": 0,
-            "should_continue": True,
-            "cached_insights": {}  # NEW: Initialize cached insights
-        }
+        embedding, cached = self._cached_result(query)
+        if cached is not None:
+            yield {"type": "final", **cached}
+            return
+        
+        initial_state = self.initial_state(query, embedding)
         
         try:
-            # Stream the graph execution
+            # Stream the graph execution; nodes emit partial updates,
+            # so merge each one into a running copy of the state
+            current_state = dict(initial_state)
             for event in self.graph.stream(initial_state):
-                # Extract node name and state from event
+                # Extract node name and state update from event
                 node_name = list(event.keys())[0]
-                node_state = event[node_name]
+                self.merge_update(current_state, event[node_name])
                 
                 # Yield intermediate state update
-                yield {
-                    "type": "intermediate",
-                    "node": node_name,
-                    "reasoning_steps": node_state.get("reasoning_steps", []),
-                    "safety_checks": node_state.get("safety_checks", []),
-                    "iteration_count": node_state.get("iteration_count", 0),
-                    "should_continue": node_state.get("should_continue", True)
-                }
+                yield self._intermediate_event(node_name, current_state)
             
             # Yield final result
-            # Get the last event's state
-            final_state = node_state
+            result = self._final_result(query, current_state)
+            self._remember_result(embedding, result)
+            yield {"type": "final", **result}
+        
+        except Exception as e:
+            yield {"type": "error", **self._error_result(query, e)}
+    
+    async def astream(self, query: str):
+        """Async variant of stream() backed by graph.astream, for event-loop callers.
+        
+        Args:
+            query: User's natural language question
             
-            yield {
-                "type": "final",
-                "success": True,
-                "query": query,
-                "response": final_state.get("response", ""),
-                "reasoning_steps": final_state.get("reasoning_steps", []),
-                "safety_checks": final_state.get("safety_checks", []),
-                "observations": final_state.get("observations", []),
-                "react_cycles": final_state.get("iteration_count", 0),
-                "retrieved_entries": len(final_state.get("retrieved_data", []))
-            }
+        Yields:
+            Same event dictionaries as stream()
+        """
+        embedding, cached = await asyncio.to_thread(self._cached_result, query)
+        if cached is not None:
+            yield {"type": "final", **cached}
+            return
+        
+        initial_state = self.initial_state(query, embedding)
+        
+        try:
+            current_state = dict(initial_state)
+            async for event in self.graph.astream(initial_state):
+                node_name = next(iter(event))
+                self.merge_update(current_state, event[node_name])
+                yield self._intermediate_event(node_name, current_state)
+            
+            result = self._final_result(query, current_state)
+            self._remember_result(embedding, result)
+            yield {"type": "final", **result}
         
         except Exception as e:
-            yield {
-                "type": "error",
-                "success": False,
-                "query": query,
-                "error": str(e),
-                "response": f"Sorry, I encountered an error: {str(e)}",
-                "reasoning_steps": []
-            }
+            yield {"type": "error", **self._error_result(query, e)}
 
 
 # Convenience function for testing
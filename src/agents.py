@@ -1,12 +1,53 @@
 """NVIDIA Nemotron API integration for agentic lifelog."""
+import functools
 import os
 from typing import Dict, List
+import httpx
 from openai import OpenAI
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+NVIDIA_API_BASE_URL = "https://integrate.api.nvidia.com/v1"
+
+
+@functools.cache
+def get_shared_client(api_key: str) -> OpenAI:
+    """Return the process-wide NVIDIA API client for an API key.
+    
+    All agents share one client so they reuse a single pool of keep-alive
+    connections instead of each paying its own TLS handshake. HTTP/2 lets
+    concurrent calls (parallel graph branches, speculative OBSERVE) multiplex
+    over one connection.
+    
+    Args:
+        api_key: NVIDIA API key
+        
+    Returns:
+        OpenAI-compatible client backed by a pooled httpx.Client
+    """
+    return OpenAI(
+        base_url=NVIDIA_API_BASE_URL,
+        api_key=api_key,
+        http_client=httpx.Client(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+            timeout=httpx.Timeout(60.0, connect=10.0)
+        )
+    )
+
+
+def close_shared_client():
+    """Close the process-wide NVIDIA API client and drop it from the cache.
+    
+    Call once at process shutdown; agents created afterwards get a fresh client.
+    """
+    api_key = os.getenv("NVIDIA_API_KEY")
+    if api_key and get_shared_client.cache_info().currsize:
+        get_shared_client(api_key).close()
+    get_shared_client.cache_clear()
+
 
 class NemotronAgent:
     """Client for NVIDIA Nemotron models via API."""
@@ -22,10 +63,7 @@ class NemotronAgent:
             raise ValueError("NVIDIA_API_KEY environment variable not set!")
         
         self.model_name = model_name
-        self.client = OpenAI(
-            base_url="https://integrate.api.nvidia.com/v1",
-            api_key=self.api_key
-        )
+        self.client = get_shared_client(self.api_key)
     
     def generate(self, prompt: str, system_prompt: str = None, max_tokens: int = 1000) -> str:
         """Generate a response using the Nemotron model.
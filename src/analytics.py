@@ -0,0 +1,30 @@
+"""Numerical helpers shared by the Streamlit app and the API backend."""
+import numpy as np
+
+
+def category_correlation(wide: np.ndarray) -> np.ndarray:
+    """Pearson correlation between the columns of a (dates x categories) score matrix.
+    
+    Args:
+        wide: Daily mean score per category, NaN where a day has no entry
+        
+    Returns:
+        (n_categories, n_categories) correlation matrix, NaN where a pair has
+        fewer than two days in common
+    """
+    n = wide.shape[1]
+    present = ~np.isnan(wide)
+    if present.all() and len(wide) > 1:
+        # No gaps: a single corrcoef over the whole matrix
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.corrcoef(wide, rowvar=False).reshape(n, n)
+    
+    # Pairwise-complete Pearson correlation (same NaN handling as DataFrame.corr)
+    corr = np.full((n, n), np.nan)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        for i in range(n):
+            for j in range(i, n):
+                mask = present[:, i] & present[:, j]
+                if mask.sum() > 1:
+                    corr[i, j] = corr[j, i] = np.corrcoef(wide[mask, i], wide[mask, j])[0, 1]
+    return corr
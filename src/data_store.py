@@ -1,8 +1,9 @@
 """Vector database operations for personal lifelog data."""
+import hashlib
 import pandas as pd
 import chromadb
 from chromadb.config import Settings
-from typing import List, Dict
+from typing import Callable, List, Dict, Optional
 import os
 from src.nvidia_embeddings import NVIDIAEmbeddingFunction
 
@@ -19,71 +20,119 @@ class LifelogDataStore:
         self.persist_directory = persist_directory
         self.embedding_function = NVIDIAEmbeddingFunction()
         
-        self.client = chromadb.Client(Settings(
-            persist_directory=persist_directory,
-            anonymized_telemetry=False
-        ))
+        # Persistent client so embeddings survive restarts and ingestion is a one-time cost
+        self.client = chromadb.PersistentClient(
+            path=persist_directory,
+            settings=Settings(anonymized_telemetry=False)
+        )
         self.collection_name = "lifelog_entries"
         self.collection = None
         
-    def load_and_store_csv(self, csv_path: str) -> int:
+    def load_and_store_csv(
+        self,
+        csv_path: str,
+        df: Optional[pd.DataFrame] = None,
+        data_version: Optional[str] = None,
+        batch_size: int = 200,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> int:
         """Load CSV data and store in vector database.
         
         Args:
             csv_path: Path to the CSV file
+            df: Already-parsed contents of csv_path, to avoid reading the file twice
+            data_version: Content hash of csv_path (computed here if not given); the
+                persisted collection is reused only while it matches
+            batch_size: Number of entries embedded and added per collection.add call
+            progress_callback: Optional callable receiving (entries_stored, total_entries)
+                after each batch
             
         Returns:
             Number of entries stored
         """
-        # Load CSV
-        df = pd.read_csv(csv_path)
-        
-        # Create or get collection with NVIDIA embedding function
+        # Load CSV (unless the caller already parsed it)
+        if df is None:
+            df = pd.read_csv(csv_path)
+        if data_version is None:
+            with open(csv_path, "rb") as f:
+                data_version = hashlib.blake2b(f.read(), digest_size=8).hexdigest()
+        
+        # Reuse the persisted collection if it was built from this exact CSV version
         try:
-            self.collection = self.client.create_collection(
-                name=self.collection_name,
-                embedding_function=self.embedding_function,
-                metadata={"description": "Personal lifelog with NVIDIA embeddings"}
-            )
-        except Exception:
-            self.collection = self.client.get_collection(
+            existing = self.client.get_collection(
                 name=self.collection_name,
                 embedding_function=self.embedding_function
             )
-        
-        # Prepare data for embedding
-        documents = []
-        metadatas = []
-        ids = []
-        
-        for idx, row in df.iterrows():
-            # Create a rich text representation
-            doc_text = f"Date: {row['date']}\nCategory: {row['category']}\nEntry: {row['entry']}\nMood Score: {row['mood_score']}"
-            documents.append(doc_text)
-            
-            metadatas.append({
-                "date": str(row['date']),
-                "category": str(row['category']),
-                "mood_score": str(row['mood_score'])
-            })
-            
-            ids.append(f"entry_{idx}")
-        
-        # Add to collection (ChromaDB will use NVIDIA embeddings)
-        self.collection.add(
-            documents=documents,
-            metadatas=metadatas,
-            ids=ids
+        except Exception:
+            existing = None
+        if existing is not None:
+            if (existing.metadata or {}).get("data_version") == data_version and existing.count() == len(df):
+                self.collection = existing
+                if progress_callback is not None:
+                    progress_callback(len(df), len(df))
+                return len(df)
+            # Stale: drop it so rows removed from the CSV don't linger
+            self.client.delete_collection(name=self.collection_name)
+        
+        # Create collection with NVIDIA embedding function, tagged with the CSV version
+        self.collection = self.client.create_collection(
+            name=self.collection_name,
+            embedding_function=self.embedding_function,
+            metadata={
+                "description": "Personal lifelog with NVIDIA embeddings",
+                "data_version": data_version
+            }
         )
         
-        return len(documents)
+        # Prepare data for embedding (column-wise; identical text whether or not
+        # the caller parsed dates/dtypes)
+        if pd.api.types.is_datetime64_any_dtype(df['date']):
+            dates = df['date'].dt.strftime('%Y-%m-%d')
+        else:
+            dates = df['date'].astype(str)
+        categories = df['category'].astype(str)
+        mood_scores = df['mood_score'].map('{:g}'.format)
+        
+        # Create a rich text representation
+        documents = (
+            "Date: " + dates
+            + "\nCategory: " + categories
+            + "\nEntry: " + df['entry'].astype(str)
+            + "\nMood Score: " + mood_scores
+        ).tolist()
+        metadatas = [
+            {"date": date, "category": category, "mood_score": mood_score}
+            for date, category, mood_score in zip(dates, categories, mood_scores, strict=True)
+        ]
+        ids = [f"entry_{idx}" for idx in df.index]
+        
+        # Add to collection in batches (ChromaDB embeds each batch with one NVIDIA API call)
+        total = len(documents)
+        for start in range(0, total, batch_size):
+            end = min(start + batch_size, total)
+            self.collection.add(
+                documents=documents[start:end],
+                metadatas=metadatas[start:end],
+                ids=ids[start:end]
+            )
+            if progress_callback is not None:
+                progress_callback(end, total)
+        
+        return total
     
-    def query(self, query_text: str, n_results: int = 5) -> List[Dict]:
+    def query(
+        self,
+        query_text: str,
+        n_results: int = 5,
+        query_embedding: Optional[List[float]] = None
+    ) -> List[Dict]:
         """Query the vector database for relevant entries.
         
         Args:
             query_text: Natural language query
             n_results: Number of results to return
+            query_embedding: Precomputed embedding of query_text (input_type="query");
+                when given, no embedding API call is made here
             
         Returns:
             List of relevant entries with metadata
@@ -94,10 +143,16 @@ class LifelogDataStore:
                 embedding_function=self.embedding_function
             )
         
-        results = self.collection.query(
-            query_texts=[query_text],
-            n_results=n_results
-        )
+        if query_embedding is not None:
+            results = self.collection.query(
+                query_embeddings=[query_embedding],
+                n_results=n_results
+            )
+        else:
+            results = self.collection.query(
+                query_texts=[query_text],
+                n_results=n_results
+            )
         
         # Format results
         formatted_results = []
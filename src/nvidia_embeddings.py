@@ -1,5 +1,6 @@
 """NVIDIA NeMo Retriever embedding client using direct API calls."""
 import os
+import threading
 import requests
 from typing import List, Union
 from dotenv import load_dotenv
@@ -22,6 +23,19 @@ class NVIDIAEmbeddingClient:
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
         }
+        # Keep-alive sessions so repeated embedding calls reuse the TLS connection;
+        # requests.Session is not thread-safe, so each thread gets its own
+        self._local = threading.local()
+    
+    @property
+    def session(self) -> requests.Session:
+        """Keep-alive session owned by the calling thread."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(self.headers)
+            self._local.session = session
+        return session
     
     def embed_texts(self, texts: Union[str, List[str]], input_type: str = "passage") -> List[List[float]]:
         """Generate embeddings for one or more texts.
@@ -43,11 +57,7 @@ class NVIDIAEmbeddingClient:
             "encoding_format": "float"
         }
         
-        response = requests.post(
-            self.api_url, 
-            headers=self.headers, 
-            json=payload
-        )
+        response = self.session.post(self.api_url, json=payload)
         
         if response.status_code != 200:
             raise Exception(f"NVIDIA API error: {response.status_code} - {response.text}")
@@ -0,0 +1,94 @@
+"""Semantic cache of workflow results keyed by query embedding."""
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+
+class SemanticCache:
+    """Bounded cache that returns a stored result for queries with a near-identical embedding.
+
+    Embeddings are kept L2-normalized in one preallocated (max_entries, dim) float32
+    matrix, so a lookup is a single matrix-vector product rather than a loop over entries.
+    When full, the entry with the lowest hits x recency score is overwritten in place.
+    """
+
+    def __init__(self, max_entries: int = 1024, threshold: float = 0.95):
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum number of cached results
+            threshold: Minimum cosine similarity for a lookup to count as a hit
+        """
+        self.max_entries = max_entries
+        self.threshold = threshold
+        self._matrix = None  # allocated on first store, once the embedding size is known
+        self._results: List[Optional[Dict[str, Any]]] = [None] * max_entries
+        self._hits = np.zeros(max_entries)
+        self._last_used = np.zeros(max_entries)
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize(embedding) -> np.ndarray:
+        """Convert an embedding to a unit-length float32 vector."""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def lookup(self, embedding) -> Optional[Dict[str, Any]]:
+        """Return the cached result for the most similar query, if above the threshold.
+
+        Args:
+            embedding: Query embedding vector
+
+        Returns:
+            Cached result dictionary, or None on a miss
+        """
+        vector = self._normalize(embedding)
+        with self._lock:
+            if not self._size or self._matrix.shape[1] != vector.shape[0]:
+                return None
+            similarities = self._matrix[:self._size] @ vector
+            best = int(np.argmax(similarities))
+            if similarities[best] < self.threshold:
+                return None
+            self._hits[best] += 1
+            self._last_used[best] = time.monotonic()
+            return self._results[best]
+
+    def store(self, embedding, result: Dict[str, Any]):
+        """Cache a result under its query embedding.
+
+        Args:
+            embedding: Query embedding vector
+            result: Workflow result dictionary to return for similar queries
+        """
+        vector = self._normalize(embedding)
+        with self._lock:
+            if self._matrix is None or self._matrix.shape[1] != vector.shape[0]:
+                self._matrix = np.zeros((self.max_entries, vector.shape[0]), dtype=np.float32)
+                self._size = 0
+
+            now = time.monotonic()
+            if self._size < self.max_entries:
+                slot = self._size
+                self._size += 1
+            else:
+                # Evict the least valuable entry: frequently hit, recently used entries stay
+                score = (1 + self._hits) / (1 + now - self._last_used)
+                slot = int(np.argmin(score))
+
+            self._matrix[slot] = vector
+            self._results[slot] = result
+            self._hits[slot] = 0
+            self._last_used[slot] = now
+
+    def clear(self):
+        """Drop every cached result, e.g. after the underlying data has been reloaded."""
+        with self._lock:
+            self._results = [None] * self.max_entries
+            self._hits[:] = 0
+            self._last_used[:] = 0
+            self._size = 0